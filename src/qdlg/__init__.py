@@ -14,5 +14,5 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from .widgets import *  # NOQA
-from .qdlg import QDlg  # NOQA
+from .qdlg import QDlg, DialogResult, setDialogCacheSize  # NOQA
 from .observable import *  # NOQA
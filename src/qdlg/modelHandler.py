@@ -13,51 +13,100 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from .observable.ObservableBase import ObservableBase
+from .observable.ObservableBase import ObservableBase, observableVersion
+from .observable.ref import ObservableRef
 
 
-def configureModel(obj: ObservableBase, onInput, setValue, *, attr=None, index=None):
+class _LastValue:
+    """Value last synced between a model and a widget.
+
+    Bound values are often observable nodes mutated in place, so the node
+    itself can't serve as the old value. Its version tells in O(1) whether
+    anything below it changed. References are compared by the node they point
+    to, as a retargeted reference is the same object, pointing elsewhere.
+    """
+
+    __slots__ = ("value", "node", "version")
+
+    def __init__(self, value):
+        self.set(value)
+
+    def set(self, value):
+        self.value = value
+        self.node = _resolve(value)
+        self.version = observableVersion(self.node)
+
+    def differsFrom(self, value):
+        if value is self.value:
+            node = _resolve(value)
+            return node is not self.node or observableVersion(node) != self.version
+        return value != self.value
+
+
+def _resolve(value):
+    if isinstance(value, ObservableRef):
+        try:
+            return value._resolve()
+        except (KeyError, IndexError, AttributeError):  # Path gone in new target
+            return None
+    return value
+
+
+def configureModel(
+    obj: ObservableBase, onInput, setValue, *, attr=None, index=None, owner=None
+):
+    """Two-way bind obj.attr or obj[index] to a widget.
+
+    The binding is released when owner, the bound QWidget, is destroyed.
+    """
     if index is None:
-        oldValue = getattr(obj, attr)
-        setValue(oldValue)
+        last = _LastValue(getattr(obj, attr))
+        setValue(last.value)
 
         def _setter():
-            nonlocal oldValue
             v = getattr(obj, attr)
-            if v != oldValue:
-                oldValue = v
+            if last.differsFrom(v):
+                last.set(v)
                 setValue(v)
 
-        obj.registerObserver(_setter)
+        handle = obj.subscribe([attr], _setter)
 
         def _onInput(v):
-            nonlocal oldValue
-            if oldValue != v:
-                oldValue = v
+            if last.differsFrom(v):
+                last.set(v)  # Don't echo v back to the widget
                 setattr(obj, attr, v)
+                last.set(getattr(obj, attr))
 
         onInput(_onInput)
 
     elif attr is None:
-        oldValue = obj[index]
-        setValue(obj[index])
+        last = _LastValue(obj[index])
+        setValue(last.value)
 
         def _setter():
-            nonlocal oldValue
             v = obj[index]
-            if v != oldValue:
-                oldValue = v
+            if last.differsFrom(v):
+                last.set(v)
                 setValue(v)
 
-        obj.registerObserver(_setter)
+        if type(index) is int and index < 0:
+            # Notifications carry the normalized index, which -1 doesn't match,
+            # and the item at -1 changes as the list grows anyway.
+            handle = obj.registerObserver(_setter)
+        else:
+            handle = obj.subscribe([index], _setter)
 
         def _onInput(v):
-            nonlocal oldValue
-            if oldValue != v:
-                oldValue = v
+            if last.differsFrom(v):
+                last.set(v)  # Don't echo v back to the widget
                 obj[index] = v
+                last.set(obj[index])
 
         onInput(_onInput)
 
     else:
         raise RuntimeError("at least one of attr and index should be None")
+
+    if owner is not None:
+        handle.disposeWith(owner)
+    return handle
@@ -14,36 +14,202 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from contextlib import contextmanager
+from .subscription import SubscriptionTrie, normalizePath, wholeNode
+from .handle import ObserverHandle, WeakHandler, removeFirst
+from .scheduler import getScheduler
+
+# Shared by all nodes without observers, which is most nodes of a big model.
+# Replaced by a per-node list on the first registerObserver.
+_noHandlers = ()
 
 
 class ObservableBase:
-    def __init__(self, parent):
-        self._handlerList = []
+    __slots__ = (
+        "_handlerList",
+        "_parent",
+        "_lazy",
+        "_suppressNotification",
+        "_version",
+        "_snapshot",
+        "_subscriptions",
+        "_changeObservers",
+        "_obj",
+    )
+
+    # Number of observeChanges() handlers alive anywhere. Change records are
+    # only built while this is nonzero.
+    _changeObserverCount = 0
+
+    def __init__(self, parent, lazy=False):
+        self._handlerList = _noHandlers
         self._parent = parent
+        self._lazy = lazy
         self._suppressNotification = 0
+        self._version = 0
+        self._snapshot = None
+        self._subscriptions = None
+        self._changeObservers = _noHandlers
+        self._obj = None
+
+    def registerObserver(self, handler, *, weak=False):
+        """Call handler on any change of this node or below.
+
+        Returns an ObserverHandle that unregisters handler when disposed. With
+        weak=True, handler isn't kept alive by this node, and is unregistered
+        automatically once it's garbage collected.
+        """
+        handle = ObserverHandle(None)
+        if weak:
+            handler = WeakHandler(handler, handle.dispose)
+
+        if self._handlerList is _noHandlers:
+            self._handlerList = [handler]
+        else:
+            self._handlerList.append(handler)
+
+        handle._remove = lambda: self._removeObserver(handler)
+        return handle
+
+    def _removeObserver(self, handler):
+        self._handlerList = removeFirst(self._handlerList, handler) or _noHandlers
+
+    def subscribe(self, path, handler, *, weak=False):
+        """Call handler when path, or anything below it, changes.
+
+        path is either a single key ("blacklistDeckIds") or a list of keys
+        (["a", 0, "b"]). Unlike registerObserver, changes elsewhere under this
+        node don't call handler. Returns an ObserverHandle, like registerObserver.
+        """
+        handle = ObserverHandle(None)
+        if weak:
+            handler = WeakHandler(handler, handle.dispose)
+
+        path = normalizePath(path)
+        if self._subscriptions is None:
+            self._subscriptions = SubscriptionTrie()
+        self._subscriptions.add(path, handler)
+
+        handle._remove = lambda: self._subscriptions.remove(path, handler)
+        return handle
+
+    def observeChanges(self, handler):
+        """Call handler(change) with a record of each change of this node or below.
+
+        Records are described in changes.py. Unlike other observers, handler runs
+        synchronously, right when the change is made, whatever the scheduler.
+        Returns an ObserverHandle.
+        """
+        self._changeObservers = self._changeObservers + (handler,)
+        ObservableBase._changeObserverCount += 1
+
+        def remove():
+            self._changeObservers = removeFirst(self._changeObservers, handler)
+            ObservableBase._changeObserverCount -= 1
+
+        return ObserverHandle(remove)
 
-    def registerObserver(self, handler):
-        self._handlerList.append(handler)
+    def _changesObserved(self):
+        """Whether observeChanges() handlers would get records of this node.
 
-    def notify(self):
-        if self._suppressNotification:
-            return
+        Records are only built then, so observing one list doesn't slow down
+        the changes of unrelated observables.
+        """
+        if not ObservableBase._changeObserverCount:
+            return False
+        node = self
+        while node is not None:
+            if node._changeObservers:
+                return True
+            node = node._parent
+        return False
 
-        for handler in self._handlerList:
-            handler()
+    def _emitChange(self, change):
+        node = self
+        while node is not None:
+            for handler in node._changeObservers:
+                handler(change)
+            node = node._parent
 
-        if self._parent is not None:
-            self._parent.notify()
+    def notify(self, key=wholeNode):
+        """Notify a change of this node, or of its child at key.
+
+        When observers run is up to the current scheduler. See setScheduler.
+        """
+        scheduler = getScheduler()
+        scheduler.enter()
+        try:
+            self._notifyChain(None, key, scheduler.schedule)
+        finally:
+            scheduler.exit()
+        scheduler.notified()
+
+    def _notifyChain(self, chain, key, schedule):
+        # Invalidate all ancestors before running any observer, so that observers
+        # see up-to-date versions and snapshots everywhere.
+        # Done even where notification is suppressed: the content did change,
+        # the notification is just deferred to the outer call.
+        node = self
+        while node is not None:
+            node._version += 1
+            node._snapshot = None
+            if node._suppressNotification:
+                break
+            node = node._parent
+
+        node = self
+        while not node._suppressNotification:
+            for handler in node._handlerList:
+                schedule(handler)
+
+            if node._subscriptions is not None:
+                node._subscriptions.dispatch(node, chain, key, schedule)
+
+            if node._parent is None:
+                break
+            chain = (node, chain)
+            node = node._parent
+
+    def _childAt(self, key):
+        """Child at key, or None if there's no such child"""
+        return None
 
     def unobserved(self):
         """Generate non-observable copy of this object"""
         raise NotImplementedError
 
+    def snapshot(self):
+        """Generate read-only, non-observable copy of this object.
+
+        Unlike unobserved(), the copy is cached and shared between calls. Each
+        change drops the cached copies only along the path from the changed node
+        to the root, so unchanged subtrees are reused by the next snapshot.
+        Don't modify the returned object.
+        """
+        if self._snapshot is None:
+            self._snapshot = self._makeSnapshot()
+        return self._snapshot
+
+    def _makeSnapshot(self):
+        raise NotImplementedError
+
+    def _isSameAs(self, obj):
+        """O(1) check for obj being self or its still-valid snapshot.
+
+        As snapshots share unchanged subtrees, comparing a node with an older
+        snapshot of it only walks the parts that changed since.
+        """
+        return obj is self or (obj is self._snapshot and obj is not None)
+
     @contextmanager
     def _noNotify(self):
+        scheduler = getScheduler()
+        scheduler.enter()
         self._suppressNotification += 1
-        yield
-        self._suppressNotification -= 1
+        try:
+            yield
+        finally:
+            self._suppressNotification -= 1
+            scheduler.exit()
 
     def _observableAssign(self, obj):
         raise NotImplementedError
@@ -56,4 +222,14 @@ class ObservableBase:
 
 
 def isObservable(obj):
-    return isinstance(obj, ObservableBase)
+    # Also true for stand-ins like ObservableRef
+    return isinstance(obj, ObservableBase) or getattr(type(obj), "_observable", False)
+
+
+def observableVersion(obj):
+    """Counter that changes whenever obj (or anything below it) changes.
+
+    Returns None for non-observable objects."""
+    if isObservable(obj):
+        return obj._version
+    return None
@@ -15,57 +15,152 @@
 
 from .utils import _forwardMethod
 from .ObservableBase import ObservableBase
-from .makeObservable import makeObservable, unobserved
+from .tracking import readStack, recordRead
+from .changes import DictSet, missing
+from .makeObservable import (
+    adoptChild,
+    wrapChildAt,
+    unobservedChild,
+    snapshot,
+)
 
 
 class ObservableDict(ObservableBase):
+    __slots__ = ()
     _observable = True
 
-    def __init__(self, obj, *, parent):
-        super().__init__(parent)
+    def __init__(self, obj, *, parent, lazy=False):
+        super().__init__(parent, lazy)
         with self._noNotify():
             self._observableAssign(obj)
 
     def unobserved(self):
-        return {k: unobserved(v) for k, v in self._obj.items()}
+        return {k: unobservedChild(v) for k, v in self._obj.items()}
+
+    def _makeSnapshot(self):
+        return {k: snapshot(v) for k, v in self._obj.items()}
 
     # Read-only methods
     __len__ = _forwardMethod("__len__", False)
-    __getitem__ = _forwardMethod("__getitem__", False)
-    get = _forwardMethod("get", False)
-    items = _forwardMethod("items", False)
     keys = _forwardMethod("keys", False)
-    values = _forwardMethod("values", False)
+
+    def __getitem__(self, key):
+        if readStack:
+            recordRead(self, key)
+
+        if not self._lazy:
+            return self._obj[key]
+        return wrapChildAt(self, key)
+
+    def get(self, key, default=None):
+        if key not in self._obj:
+            if readStack:
+                recordRead(self, key)
+            return default
+        return self[key]
+
+    def __contains__(self, key):
+        if readStack:
+            recordRead(self, key)
+        return key in self._obj
+
+    def __iter__(self):
+        if readStack:
+            recordRead(self)
+        return iter(self._obj)
+
+    def items(self):
+        if readStack:
+            recordRead(self)
+        self._wrapAll()
+        return self._obj.items()
+
+    def values(self):
+        if readStack:
+            recordRead(self)
+        self._wrapAll()
+        return self._obj.values()
+
+    def _wrapAll(self):
+        if self._lazy:
+            for k in self._obj:
+                wrapChildAt(self, k)
 
     # Writing methods
-    __delitem__ = _forwardMethod("__delitem__", True)
-    pop = _forwardMethod("pop", True)
-    clear = _forwardMethod("clear", True)
 
     def __setitem__(self, key, item):
         with self._noNotify():
             try:
                 self._obj[key]._observableAssign(item)
             except (AttributeError, KeyError):
-                item = makeObservable(item, parent=self)
-                self._obj[key] = item
+                self._setChild(key, adoptChild(item, parent=self))
 
+        self.notify(key)
+
+    def __delitem__(self, key):
+        with self._noNotify():
+            self._obj[key]  # Raises KeyError as dict does
+            self._setChild(key, missing)
+        self.notify(key)
+
+    def pop(self, key, *args):
+        with self._noNotify():
+            if key not in self._obj:
+                return self._obj.pop(key, *args)
+            ret = self._setChild(key, missing)
+        self.notify(key)
+        return ret
+
+    def clear(self):
+        with self._noNotify():
+            for key in list(self._obj):
+                self._setChild(key, missing)
         self.notify()
 
     def update(self, d):
         with self._noNotify():
-            self._obj.update({k: makeObservable(v, parent=self) for k, v in d.items()})
+            for k, v in d.items():
+                self._setChild(k, adoptChild(v, parent=self))
 
         self.notify()
 
+    def _setChild(self, key, child):
+        """Store an adopted child, or delete key if child is missing.
+
+        Returns the previous child.
+        """
+        obj = self._obj
+        old = obj.get(key, missing)
+        if child is missing:
+            del obj[key]
+        else:
+            obj[key] = child
+        if self._changesObserved():
+            self._emitChange(DictSet(self, key, old, child))
+        return old
+
     #######
 
+    def _childAt(self, key):
+        try:
+            return self._obj.get(key)
+        except TypeError:  # Unhashable key
+            return None
+
     def _observableAssign(self, obj):
         with self._noNotify():
-            self._obj = {k: makeObservable(v, parent=self) for k, v in obj.items()}
+            if self._changesObserved() and self._obj is not None:
+                for k in [k for k in self._obj if k not in obj]:
+                    self._setChild(k, missing)
+                for k, v in obj.items():
+                    self._setChild(k, adoptChild(v, parent=self))
+            else:
+                self._obj = {k: adoptChild(v, parent=self) for k, v in obj.items()}
         self.notify()
 
     def __eq__(self, obj):
+        if self._isSameAs(obj):
+            return True
         if len(self) != len(obj):
             return False
 
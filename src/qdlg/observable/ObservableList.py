@@ -15,70 +15,245 @@
 
 from .utils import _forwardMethod
 from .ObservableBase import ObservableBase
-from .makeObservable import makeObservable, unobserved
+from .tracking import readStack, recordRead
+from .changes import ListSplice, ListMove
+from .diff import matchKeys, freezeKey
+from .makeObservable import (
+    adoptChild,
+    wrapChildAt,
+    unobservedChild,
+    snapshot,
+    isImmutable,
+)
+
+_maxReconcileRecords = 64
 
 
 class ObservableList(ObservableBase):
+    __slots__ = ("_diffKey",)
     _observable = True
 
-    def __init__(self, data, *, parent):
-        super().__init__(parent)
-        self._observableAssign(data)
+    def __init__(self, data, *, parent, lazy=False):
+        super().__init__(parent, lazy)
+        self._diffKey = None
+        with self._noNotify():
+            self._obj = [adoptChild(d, parent=self) for d in data]
 
     def unobserved(self):
-        return [unobserved(v) for v in self._obj]
+        return [unobservedChild(v) for v in self._obj]
+
+    def _makeSnapshot(self):
+        return [snapshot(v) for v in self._obj]
+
+    def diffKey(self, key):
+        """Match items by key(item) when a new list is assigned to this one.
+
+        Matched items keep their wrappers and observers, and get the new content
+        assigned. Without a key, items are matched by content.
+        """
+        self._diffKey = key
+        return self
 
     # Read-only methods
     __len__ = _forwardMethod("__len__", False)
-    __getitem__ = _forwardMethod("__getitem__", False)
     index = _forwardMethod("index", False)
     count = _forwardMethod("count", False)
 
+    def __getitem__(self, index):
+        if readStack:
+            recordRead(self, index)
+
+        if not self._lazy:
+            return self._obj[index]
+
+        if isinstance(index, slice):
+            return [wrapChildAt(self, i) for i in range(*index.indices(len(self._obj)))]
+        return wrapChildAt(self, index)
+
+    def __iter__(self):
+        if readStack:
+            recordRead(self)
+
+        if not self._lazy:
+            return iter(self._obj)
+        return (wrapChildAt(self, i) for i in range(len(self._obj)))
+
     # Writing methods
-    pop = _forwardMethod("pop", True)
-    clear = _forwardMethod("clear", True)
 
     def __setitem__(self, index, item):
         with self._noNotify():
             if isinstance(index, slice):
-                items = [makeObservable(d, parent=self) for d in item]
+                items = list(item)
                 try:
                     targets = self._obj[index]
                     for t, i in zip(targets, items):
                         t._observableAssign(i)
                 except AttributeError:
-                    self._obj[index] = items
+                    self._replaceSlice(index, items)
 
             else:
-                item = makeObservable(item, parent=self)
                 try:
                     self._obj[index]._observableAssign(item)
                 except AttributeError:
-                    self._obj[index] = item
+                    index = index % len(self._obj)
+                    self._splice(index, 1, [item])
 
-        self.notify()
+        if isinstance(index, slice):
+            self.notify()
+        else:
+            self.notify(index % len(self._obj))
 
     def append(self, item):
         with self._noNotify():
-            self._obj.append(makeObservable(item, parent=self))
-        self.notify()
+            self._splice(len(self._obj), 0, [item])
+        self.notify(len(self._obj) - 1)
 
     def extend(self, iterable):
         with self._noNotify():
-            self._obj.extend(makeObservable(d, parent=self) for d in iterable)
+            self._splice(len(self._obj), 0, list(iterable))
         self.notify()
 
     def insert(self, index, item):
         with self._noNotify():
-            self._obj.insert(index, makeObservable(item, parent=self))
+            # Clamp as list.insert does
+            n = len(self._obj)
+            if index < 0:
+                index = max(0, n + index)
+            index = min(index, n)
+            self._splice(index, 0, [item])
         self.notify()
 
+    def pop(self, index=-1):
+        with self._noNotify():
+            self._obj[index]  # Raises IndexError as list.pop does
+            index = index % len(self._obj)
+            ret = self._splice(index, 1, [])[0]
+        self.notify()
+        return ret
+
+    def clear(self):
+        with self._noNotify():
+            self._splice(0, len(self._obj), [])
+        self.notify()
+
+    def _splice(self, index, removeCount, items):
+        """Replace removeCount items at index with items. Returns removed items"""
+        removed = self._obj[index : index + removeCount]
+        inserted = [adoptChild(d, parent=self) for d in items]
+        self._obj[index : index + removeCount] = inserted
+        if self._changesObserved():
+            self._emitChange(ListSplice(self, index, removed, inserted))
+        return removed
+
+    def _move(self, fromIndex, toIndex):
+        self._obj.insert(toIndex, self._obj.pop(fromIndex))
+        if self._changesObserved():
+            self._emitChange(ListMove(self, fromIndex, toIndex))
+
+    def _replaceSlice(self, index, items):
+        start, stop, step = index.indices(len(self._obj))
+        if step == 1:
+            self._splice(start, max(stop - start, 0), items)
+        else:
+            indices = range(start, stop, step)
+            if len(indices) != len(items):
+                raise ValueError(
+                    "attempt to assign sequence of size %d to extended slice of size %d"
+                    % (len(items), len(indices))
+                )
+            for i, item in zip(indices, items):
+                self._splice(i, 1, [item])
+
+    def _childAt(self, key):
+        try:
+            return self._obj[key]
+        except (IndexError, TypeError):
+            return None
+
     def _observableAssign(self, obj):
         with self._noNotify():
-            self._obj = [makeObservable(d, parent=self) for d in obj]
+            self._reconcile(list(obj))
         self.notify()
 
+    def _reconcile(self, items):
+        """Turn self into items with the least insertions, moves and removals.
+
+        Matching children are kept with their observers.
+        """
+        old = self._obj
+        keyFn = self._diffKey
+        if keyFn is None:
+            oldKeys = [_contentKey(v) for v in old]
+            newKeys = [_contentKey(v) for v in items]
+        else:
+            oldKeys = [keyFn(v) for v in old]
+            newKeys = [keyFn(v) for v in items]
+
+        matches, stable = matchKeys(oldKeys, newKeys)
+
+        result = [None] * len(items)
+        for i, j in list(matches.items()):
+            child = old[i]
+            if keyFn is not None and (
+                child != items[j] or type(child) is not type(items[j])
+            ):
+                # Same key, different content. 1 == True, but they still differ.
+                try:
+                    child._observableAssign(items[j])
+                except AttributeError:  # Immutable, or unwrapped in lazy mode
+                    del matches[i]
+                    stable.discard(i)
+                    continue
+            result[j] = child
+
+        for j, child in enumerate(result):
+            if child is None:
+                result[j] = adoptChild(items[j], parent=self)
+
+        if self._changesObserved():
+            self._emitReconcile(old, matches, stable, result)
+        self._obj = result
+
+    def _emitReconcile(self, old, matches, stable, result):
+        """Emit removals, then moves, then insertions turning old into result.
+
+        Past _maxReconcileRecords records, emits a single splice replacing
+        everything instead, as each record costs O(n) to apply.
+        """
+        recordCount = len(old) + len(result) - len(matches) - len(stable)
+        if recordCount > _maxReconcileRecords:
+            self._emitChange(ListSplice(self, 0, list(old), list(result)))
+            return
+
+        # Track items by old index, as equal values may be the same object
+        work = list(range(len(old)))
+        for i in reversed(work):
+            if i not in matches:
+                work.pop(i)
+                self._emitChange(ListSplice(self, i, [old[i]], []))
+
+        # Move each unstable item right after its predecessor in the new order
+        kept = sorted(matches, key=matches.get)
+        for t, i in enumerate(kept):
+            if i in stable:
+                continue
+            f = work.index(i)
+            work.pop(f)
+            to = work.index(kept[t - 1]) + 1 if t else 0
+            work.insert(to, i)
+            if f != to:
+                self._emitChange(ListMove(self, f, to))
+
+        newToOld = {j: i for i, j in matches.items()}
+        for j, child in enumerate(result):
+            i = newToOld.get(j)
+            if i is None:
+                work.insert(j, None)
+                self._emitChange(ListSplice(self, j, [], [child]))
+
     def __eq__(self, obj):
+        if self._isSameAs(obj):
+            return True
         if len(self) != len(obj):
             return False
 
@@ -86,3 +261,41 @@ class ObservableList(ObservableBase):
             if a != b:
                 return False
         return True
+
+
+class ObservableByteArray(ObservableList):
+    """bytearray, edited through the ObservableList methods"""
+
+    __slots__ = ()
+
+    def __init__(self, data, *, parent, lazy=False):
+        ObservableBase.__init__(self, parent, lazy)
+        self._diffKey = None
+        self._obj = bytearray(data)
+
+    def unobserved(self):
+        return bytearray(self._obj)
+
+    def _makeSnapshot(self):
+        return bytes(self._obj)
+
+    def _observableAssign(self, obj):
+        with self._noNotify():
+            self._splice(0, len(self._obj), bytearray(obj))
+        self.notify()
+
+    def __eq__(self, obj):
+        if self._isSameAs(obj):
+            return True
+        if isinstance(obj, ObservableByteArray):
+            obj = obj._obj
+        return self._obj == obj
+
+
+def _contentKey(value):
+    if isImmutable(value):
+        return freezeKey(value)
+    try:
+        return freezeKey(snapshot(value))
+    except NotImplementedError:  # Objects have no snapshot
+        return ("id", id(value))
@@ -15,8 +15,11 @@
 
 from .utils import bind, _forwardMethod
 from .ObservableBase import ObservableBase
-from .makeObservable import makeObservable
+from .tracking import readStack, recordRead
+from .changes import AttrSet, missing
+from .makeObservable import adoptChild, isUnwrapped, makeObservable
 import inspect
+from collections import OrderedDict
 
 
 _observableMethods = {"registerObserver", "notify", "_observableAssign", "_obj"}
@@ -31,70 +34,148 @@ def nonObservableAttribute(obj, attrName):
     )
 
 
+# (class, instance attribute names) -> sorted tuple of observable attribute names,
+# least recently used first. Bounded, as attribute names may be dynamic.
+_schemaCache = OrderedDict()
+_schemaCacheSize = 256
+
+
+def _schemaOf(obj):
+    instanceDict = getattr(obj, "__dict__", None)
+    shape = (type(obj), None if instanceDict is None else frozenset(instanceDict))
+    try:
+        _schemaCache.move_to_end(shape)
+        return _schemaCache[shape]
+    except KeyError:
+        pass
+
+    schema = tuple(sorted(n for n in dir(obj) if not nonObservableAttribute(obj, n)))
+    _schemaCache[shape] = schema
+    if len(_schemaCache) > _schemaCacheSize:
+        _schemaCache.popitem(last=False)
+    return schema
+
+
 def observableAttributes(obj):
     if isinstance(obj, ObservableObject):
-        return observableAttributes(obj._obj)
+        return obj._attributeSchema()[1]
 
-    return sorted(n for n in dir(obj) if not nonObservableAttribute(obj, n))
+    return _schemaOf(obj)
 
 
-_classAttributes = {"_handlerList", "_parent", "_suppressNotification", "_obj"}
+# Attributes of the wrapper itself, as opposed to the ones of the wrapped object
+_classAttributes = frozenset(ObservableBase.__slots__) | {"_schema"}
 
 
 class ObservableObject(ObservableBase):
+    __slots__ = ("_schema",)
     _observable = True
 
-    def __init__(self, obj, *, parent):
-        super().__init__(parent)
+    def __init__(self, obj, *, parent, lazy=False):
+        super().__init__(parent, lazy)
+        self._schema = None
 
-        # _observableAssign uses dir(self._obj) to figure out what keys to assign.
-        # so we first need to set self._obj to obj
         self._obj = obj
-        self._observableAssign(obj)
+        with self._noNotify():
+            for name in self._attributeSchema()[1]:
+                setattr(obj, name, adoptChild(getattr(obj, name), parent=self))
 
     def unobserved(self):
         # Class may have custom constructor and custom semantics which we cannot follow readily.
         # so we just give up on implementing this.
         raise NotImplementedError
 
+    def _attributeSchema(self):
+        """(attribute count, observable attribute names, same as a set) of _obj
+
+        Attribute names only change when the instance __dict__ gains or loses
+        keys, so the reflection in _schemaOf runs once per class and shape.
+        _setChild drops the schema when it adds or deletes an attribute, and the
+        count catches other changes to the instance __dict__.
+        """
+        instanceDict = getattr(self._obj, "__dict__", None)
+        count = -1 if instanceDict is None else len(instanceDict)
+        schema = self._schema
+        if schema is None or schema[0] != count:
+            attrs = _schemaOf(self._obj)
+            schema = self._schema = (count, attrs, frozenset(attrs))
+        return schema
+
     ##
     __hash__ = _forwardMethod("__hash__", False)
 
     def __getattr__(self, name):
+        # Only reached for unset slots, which must not be forwarded to _obj
+        if name in _classAttributes:
+            raise AttributeError(name)
+
+        if readStack:
+            recordRead(self, name)
+
         ret = getattr(self._obj, name)
         if inspect.ismethod(ret):
             return bind(self, getattr(type(self._obj), name))
+        elif self._lazy and isUnwrapped(ret) and not name.startswith("__"):
+            ret = makeObservable(ret, parent=self, lazy=True)
+            setattr(self._obj, name, ret)
+            return ret
         else:
             return ret
 
     def __setattr__(self, name, value):
         if name in _classAttributes:
-            return super().__setattr__(name, value)
+            return object.__setattr__(self, name, value)
 
-        if not nonObservableAttribute(self, name):
+        if name in self._attributeSchema()[2]:
             target = getattr(self._obj, name)
             with self._noNotify():
                 try:
                     target._observableAssign(value)
                 except AttributeError:
-                    setattr(self._obj, name, value)
-            self.notify()
-        else:
+                    self._setChild(name, adoptChild(value, parent=self))
+            self.notify(name)
+        elif hasattr(self._obj, name):  # Methods and such
             setattr(self._obj, name, value)
+        else:  # New attribute
+            with self._noNotify():
+                self._setChild(name, adoptChild(value, parent=self))
+            self.notify(name)
+
+    def _setChild(self, name, child):
+        """Set an adopted child, or delete the attribute if child is missing.
+
+        Returns the previous child.
+        """
+        old = getattr(self._obj, name, missing)
+        if old is missing or child is missing:
+            self._schema = None
+        if child is missing:
+            delattr(self._obj, name)
+        else:
+            setattr(self._obj, name, child)
+        if self._changesObserved():
+            self._emitChange(AttrSet(self, name, old, child))
+        return old
+
+    def _childAt(self, key):
+        if type(key) is not str:
+            return None
+        return getattr(self._obj, key, None)
 
     def _observableAssign(self, obj):
         with self._noNotify():
-            for name in observableAttributes(self._obj):
-                old = getattr(obj, name)
-                setattr(self._obj, name, makeObservable(old, parent=self))
+            for name in self._attributeSchema()[1]:
+                self._setChild(name, adoptChild(getattr(obj, name), parent=self))
         self.notify()
 
     def __eq__(self, obj):
-        assignerAttributes = observableAttributes(self)
-        assigneeAttributes = observableAttributes(obj)
-        if assigneeAttributes != assigneeAttributes:
+        if self._isSameAs(obj):
+            return True
+
+        attributes = observableAttributes(self)
+        if attributes != observableAttributes(obj):
             return False
-        for k in assignerAttributes:
-            if getattr(self, k) != getattr(self._obj, k):
+        for k in attributes:
+            if getattr(self._obj, k) != getattr(obj, k):
                 return False
         return True
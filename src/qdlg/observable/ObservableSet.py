@@ -0,0 +1,150 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .utils import _forwardMethod
+from .ObservableBase import ObservableBase
+from .tracking import readStack, recordRead
+from .changes import SetChange
+
+
+def _operator(name):
+    def _(self, other):
+        if readStack:
+            recordRead(self)
+        if isinstance(other, ObservableSet):
+            other = other._obj
+        return getattr(self._obj, name)(other)
+
+    return _
+
+
+class ObservableSet(ObservableBase):
+    """Set of hashable, so immutable, elements.
+
+    Only operations that actually add or remove elements notify. Adding or
+    removing a single element notifies with the element as the key, so
+    subscribe([element]) observes its membership.
+    """
+
+    __slots__ = ()
+    _observable = True
+
+    def __init__(self, data, *, parent, lazy=False):
+        super().__init__(parent, lazy)
+        self._obj = set(data)
+
+    def unobserved(self):
+        return set(self._obj)
+
+    def _makeSnapshot(self):
+        return frozenset(self._obj)
+
+    # Read-only methods
+    __len__ = _forwardMethod("__len__", False)
+    isdisjoint = _forwardMethod("isdisjoint", False)
+    issubset = _forwardMethod("issubset", False)
+    issuperset = _forwardMethod("issuperset", False)
+    union = _forwardMethod("union", False)
+    intersection = _forwardMethod("intersection", False)
+    difference = _forwardMethod("difference", False)
+    symmetric_difference = _forwardMethod("symmetric_difference", False)
+
+    __sub__ = _operator("__sub__")
+    __rsub__ = _operator("__rsub__")
+    __and__ = _operator("__and__")
+    __rand__ = _operator("__rand__")
+    __or__ = _operator("__or__")
+    __ror__ = _operator("__ror__")
+    __xor__ = _operator("__xor__")
+    __rxor__ = _operator("__rxor__")
+    __le__ = _operator("__le__")
+    __lt__ = _operator("__lt__")
+    __ge__ = _operator("__ge__")
+    __gt__ = _operator("__gt__")
+
+    def __contains__(self, element):
+        if readStack:
+            recordRead(self, element)
+        return element in self._obj
+
+    def __iter__(self):
+        if readStack:
+            recordRead(self)
+        return iter(self._obj)
+
+    # Writing methods
+
+    def add(self, element):
+        if element not in self._obj:
+            self._change((element,), ())
+
+    def discard(self, element):
+        if element in self._obj:
+            self._change((), (element,))
+
+    def remove(self, element):
+        if element not in self._obj:
+            raise KeyError(element)
+        self._change((), (element,))
+
+    def pop(self):
+        if not self._obj:
+            raise KeyError("pop from an empty set")
+        element = next(iter(self._obj))
+        self._change((), (element,))
+        return element
+
+    def clear(self):
+        self._change((), tuple(self._obj))
+
+    def update(self, *others):
+        obj = self._obj
+        added = {e for other in others for e in other if e not in obj}
+        self._change(tuple(added), ())
+
+    def difference_update(self, *others):
+        obj = self._obj
+        removed = {e for other in others for e in other if e in obj}
+        self._change((), tuple(removed))
+
+    def intersection_update(self, *others):
+        kept = self._obj.intersection(*others)
+        self._change((), tuple(self._obj - kept))
+
+    def _change(self, added, removed):
+        if not added and not removed:
+            return
+
+        with self._noNotify():
+            self._obj.difference_update(removed)
+            self._obj.update(added)
+            if self._changesObserved():
+                self._emitChange(SetChange(self, added, removed))
+
+        if len(added) + len(removed) == 1:
+            self.notify(added[0] if added else removed[0])
+        else:
+            self.notify()
+
+    def _observableAssign(self, obj):
+        obj = set(obj)
+        self._change(tuple(obj - self._obj), tuple(self._obj - obj))
+
+    def __eq__(self, obj):
+        if self._isSameAs(obj):
+            return True
+        if isinstance(obj, ObservableSet):
+            obj = obj._obj
+        return self._obj == obj
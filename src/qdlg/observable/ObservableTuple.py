@@ -0,0 +1,94 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .utils import _forwardMethod
+from .ObservableBase import ObservableBase
+from .tracking import readStack, recordRead
+from .makeObservable import (
+    adoptChild,
+    wrapChildAt,
+    unobservedChild,
+    snapshot,
+)
+
+
+class ObservableTuple(ObservableBase):
+    """Tuple holding mutable children.
+
+    The tuple itself never changes, so it only relays the notifications of its
+    children. Tuples of immutable values aren't wrapped at all.
+    """
+
+    __slots__ = ()
+    _observable = True
+
+    def __init__(self, data, *, parent, lazy=False):
+        super().__init__(parent, lazy)
+        # A list, so that children wrapped on first access can be stored back
+        self._obj = [adoptChild(d, parent=self) for d in data]
+
+    def unobserved(self):
+        return tuple(unobservedChild(v) for v in self._obj)
+
+    def _makeSnapshot(self):
+        return tuple(snapshot(v) for v in self._obj)
+
+    # Read-only methods
+    __len__ = _forwardMethod("__len__", False)
+    index = _forwardMethod("index", False)
+    count = _forwardMethod("count", False)
+
+    def __getitem__(self, index):
+        if readStack:
+            recordRead(self, index)
+
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self._obj)))
+            if not self._lazy:
+                return tuple(self._obj[i] for i in indices)
+            return tuple(wrapChildAt(self, i) for i in indices)
+
+        if not self._lazy:
+            return self._obj[index]
+        return wrapChildAt(self, index)
+
+    def __iter__(self):
+        if readStack:
+            recordRead(self)
+
+        if not self._lazy:
+            return iter(self._obj)
+        return (wrapChildAt(self, i) for i in range(len(self._obj)))
+
+    def _childAt(self, key):
+        try:
+            return self._obj[key]
+        except (IndexError, TypeError):
+            return None
+
+    def _observableAssign(self, obj):
+        # Tuples can't be assigned into. Parents replace the child instead.
+        raise AttributeError("tuple is immutable")
+
+    def __eq__(self, obj):
+        if self._isSameAs(obj):
+            return True
+        if len(self) != len(obj):
+            return False
+
+        for a, b in zip(self, obj):
+            if a != b:
+                return False
+        return True
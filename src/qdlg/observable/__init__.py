@@ -13,12 +13,35 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from .makeObservable import makeObservable, unobserved
+from .makeObservable import makeObservable, unobserved, snapshot
 from .ObservableBase import isObservable
+from .computed import computed
+from .history import History
+from .scheduler import (
+    SyncScheduler,
+    MicrotaskScheduler,
+    QtIdleScheduler,
+    QtThreadScheduler,
+    getScheduler,
+    setScheduler,
+)
 
 
-def observable(obj):
-    return makeObservable(obj, parent=None)
+def observable(obj, *, lazy=False):
+    return makeObservable(obj, parent=None, lazy=lazy)
 
 
-__all__ = ["observable", "isObservable", "unobserved"]
+__all__ = [
+    "observable",
+    "isObservable",
+    "unobserved",
+    "snapshot",
+    "computed",
+    "History",
+    "SyncScheduler",
+    "MicrotaskScheduler",
+    "QtIdleScheduler",
+    "QtThreadScheduler",
+    "getScheduler",
+    "setScheduler",
+]
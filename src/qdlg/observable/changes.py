@@ -0,0 +1,37 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Change records, delivered to observeChanges() handlers.
+
+Records hold the affected children as stored in the node, so removed values
+may be observable wrappers. Indices are the ones at the time of the change.
+"""
+
+from collections import namedtuple
+
+
+class _Missing:
+    def __repr__(self):
+        return "missing"
+
+
+# Old or new value of a key or attribute that didn't or doesn't exist
+missing = _Missing()
+
+ListSplice = namedtuple("ListSplice", "node index removed inserted")
+ListMove = namedtuple("ListMove", "node fromIndex toIndex")
+DictSet = namedtuple("DictSet", "node key old new")
+AttrSet = namedtuple("AttrSet", "node name old new")
+SetChange = namedtuple("SetChange", "node added removed")
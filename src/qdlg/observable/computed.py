@@ -0,0 +1,109 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .ObservableBase import ObservableBase
+from .makeObservable import snapshot, unobserved
+from .subscription import wholeNode
+from .tracking import readStack, recordRead, trackReads
+
+
+class Computed(ObservableBase):
+    """Value derived from other observables. See computed()."""
+
+    __slots__ = ("_fn", "_dirty", "_dependencies", "_versions", "__weakref__")
+
+    def __init__(self, fn):
+        super().__init__(None)
+        self._fn = fn
+        self._dirty = True
+        self._dependencies = []
+        self._versions = []
+
+    @property
+    def value(self):
+        if self._dirty:
+            self._recompute()
+        if readStack:
+            recordRead(self)
+        return self._obj
+
+    def _recompute(self):
+        for handle in self._dependencies:
+            handle.dispose()
+
+        with trackReads() as tracker:
+            value = self._fn()
+
+        # Weak, so that dependencies don't keep an unused computed alive
+        dependencies = []
+        versions = []
+        for node, key in tracker.dependencies():
+            versions.append((node, node._version))
+            if key is wholeNode:
+                handle = node.registerObserver(self._invalidate, weak=True)
+            else:
+                handle = node.subscribe([key], self._invalidate, weak=True)
+            dependencies.append(handle)
+
+        self._dependencies = dependencies
+        self._versions = versions
+        self._obj = value
+        self._dirty = False
+
+    def _invalidate(self):
+        if self._dirty:
+            return
+
+        # Recomputing from an observer of the same change subscribes while that
+        # change is still being dispatched. Ignore it if we've already seen it.
+        if all(node._version == version for node, version in self._versions):
+            return
+
+        # Recomputed on next read, so a computed nobody reads costs nothing
+        self._dirty = True
+        self.notify()
+
+    def unobserved(self):
+        return unobserved(self.value)
+
+    def _makeSnapshot(self):
+        return snapshot(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __getitem__(self, index):
+        return self.value[index]
+
+    def __eq__(self, obj):
+        return self.value == obj
+
+    def __str__(self):
+        return "computed(%s)" % self.value
+
+    def __repr__(self):
+        return "computed(%s)" % repr(self.value)
+
+
+def computed(fn):
+    """Observable value of fn(), recomputed only when something it read changes.
+
+    Observables read by fn are tracked down to the key, so fn reading
+    config["decks"] doesn't recompute on a change of config["hotkey"].
+    """
+    return Computed(fn)
@@ -0,0 +1,108 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from bisect import bisect_left
+from collections import deque
+
+
+def matchKeys(oldKeys, newKeys):
+    """Match items of two keyed sequences.
+
+    Items with equal keys are matched in order of occurrence. Returns
+    (matches, stable) where matches maps old indices to new indices, and stable
+    is the set of old indices forming the longest common subsequence of
+    matches. Matched items outside of it need to be moved.
+    """
+    pending = {}
+    for j, key in enumerate(newKeys):
+        try:
+            pending[key].append(j)
+        except KeyError:
+            pending[key] = deque([j])
+
+    matches = {}
+    for i, key in enumerate(oldKeys):
+        queue = pending.get(key)
+        if queue:
+            matches[i] = queue.popleft()
+
+    return matches, _longestIncreasing(matches)
+
+
+def _longestIncreasing(matches):
+    """Old indices of the longest run of matches with increasing new indices.
+
+    With every key matched at most once, this is the LCS of both sequences,
+    found in O(n log n) by patience sorting.
+    """
+    olds = list(matches)  # Increasing, as matches was filled in order
+    tails = []  # tails[k]: new index ending the best run of length k + 1
+    tailOlds = []
+    previous = {}
+    for i in olds:
+        j = matches[i]
+        k = bisect_left(tails, j)
+        if k == len(tails):
+            tails.append(j)
+            tailOlds.append(i)
+        else:
+            tails[k] = j
+            tailOlds[k] = i
+        previous[i] = tailOlds[k - 1] if k else None
+
+    stable = set()
+    i = tailOlds[-1] if tailOlds else None
+    while i is not None:
+        stable.add(i)
+        i = previous[i]
+    return stable
+
+
+# Keys of their own: no value of another type compares equal to these
+_selfKeyed = frozenset((str, bytes, int, type(None)))
+
+
+def freezeKey(value, *, strict=False):
+    """Hashable key equal for equal plain values.
+
+    Values of different types get different keys, even though 1 == 1.0 == True.
+    Other unhashable values are keyed by id(), which is only unique while they
+    are alive. With strict=True, those raise TypeError instead.
+    """
+    t = type(value)
+    if t in _selfKeyed:
+        return value
+    if t is dict:
+        return (
+            dict,
+            frozenset(
+                (
+                    k if type(k) in _selfKeyed else freezeKey(k),
+                    v if type(v) in _selfKeyed else freezeKey(v, strict=strict),
+                )
+                for k, v in value.items()
+            ),
+        )
+    if t is list or t is tuple:
+        return (t, tuple(freezeKey(v, strict=strict) for v in value))
+    if t is set or t is frozenset:
+        return (t, frozenset(freezeKey(v) for v in value))
+    try:
+        hash(value)
+        return (t, value)
+    except TypeError:
+        if strict:
+            raise
+        return ("id", id(value))
@@ -0,0 +1,85 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import inspect
+import weakref
+
+
+class ObserverHandle:
+    """Registration of an observer. dispose() unregisters it.
+
+    Can also be used as a context manager, disposing on exit.
+    """
+
+    __slots__ = ("_remove",)
+
+    def __init__(self, remove):
+        self._remove = remove
+
+    @property
+    def disposed(self):
+        return self._remove is None
+
+    def dispose(self):
+        remove = self._remove
+        if remove is not None:
+            self._remove = None
+            remove()
+
+    def disposeWith(self, qobject):
+        """Dispose when qobject (usually the widget bound to the model) is destroyed"""
+        qobject.destroyed.connect(lambda *args: self.dispose())
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.dispose()
+        return False
+
+
+class WeakHandler:
+    """Calls handler without keeping it alive.
+
+    Bound methods are referenced with WeakMethod, so registering
+    widget.refresh doesn't keep the widget alive either.
+    """
+
+    __slots__ = ("_ref",)
+
+    def __init__(self, handler, onDead):
+        callback = lambda ref: onDead()  # NOQA
+        if inspect.ismethod(handler):
+            self._ref = weakref.WeakMethod(handler, callback)
+        else:
+            self._ref = weakref.ref(handler, callback)
+
+    def __call__(self):
+        handler = self._ref()
+        if handler is not None:
+            handler()
+
+
+def removeFirst(handlerList, handler):
+    """Copy of handlerList without the first occurrence of handler.
+
+    Handler lists are replaced instead of modified, so a dispose() from inside
+    a handler doesn't disturb the dispatch loop running over the old list.
+    """
+    for i, h in enumerate(handlerList):
+        if h is handler:
+            return handlerList[:i] + handlerList[i + 1 :]
+    return handlerList
@@ -0,0 +1,154 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Undo/redo for observable trees.
+
+History records the change records of a tree instead of copies of it, so
+each edit costs memory in proportion to what it changed.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+
+from .changes import ListSplice, ListMove, DictSet, AttrSet, SetChange
+
+
+class History:
+    """Undo/redo journal of changes made to root and its descendants.
+
+    Changes are grouped into undo steps. A step ends when root notifies its
+    observers, so with a batching scheduler a whole batch is one step. Use
+    transaction() to group changes explicitly. At most limit change records
+    are kept, dropping the oldest steps first.
+    """
+
+    def __init__(self, root, *, limit=10000):
+        self._root = root
+        self._limit = limit
+        self._undoStack = deque()
+        self._redoStack = []
+        self._recordCount = 0
+        self._current = []
+        self._transactionDepth = 0
+        self._replaying = None
+        self._changeHandle = root.observeChanges(self._onChange)
+        self._observerHandle = root.registerObserver(self._endStep)
+
+    def dispose(self):
+        self._changeHandle.dispose()
+        self._observerHandle.dispose()
+        self.clear()
+
+    def clear(self):
+        self._undoStack.clear()
+        self._redoStack.clear()
+        self._current = []
+        self._recordCount = 0
+
+    def canUndo(self):
+        return bool(self._current or self._undoStack)
+
+    def canRedo(self):
+        return bool(self._redoStack) and not self._current
+
+    @contextmanager
+    def transaction(self):
+        """Make the changes done inside one undo step"""
+        self._endStep()
+        self._transactionDepth += 1
+        try:
+            yield self
+        finally:
+            self._transactionDepth -= 1
+            self._endStep()
+
+    def undo(self):
+        """Revert the last step. Returns False if there was nothing to undo"""
+        self._endStep()
+        if not self._undoStack:
+            return False
+
+        step = self._undoStack.pop()
+        self._recordCount -= len(step)
+        self._redoStack.append(self._revert(step))
+        return True
+
+    def redo(self):
+        """Redo the last undone step. Returns False if there was nothing to redo"""
+        self._endStep()
+        if not self._redoStack:
+            return False
+
+        self._push(self._revert(self._redoStack.pop()))
+        return True
+
+    def _onChange(self, change):
+        if self._replaying is not None:
+            self._replaying.append(change)
+            return
+
+        self._current.append(change)
+        self._redoStack.clear()
+
+    def _endStep(self):
+        if self._transactionDepth or not self._current:
+            return
+
+        step = self._current
+        self._current = []
+        self._push(step)
+
+    def _push(self, step):
+        self._undoStack.append(step)
+        self._recordCount += len(step)
+        while self._recordCount > self._limit and len(self._undoStack) > 1:
+            self._recordCount -= len(self._undoStack.popleft())
+
+    def _revert(self, step):
+        """Apply the inverse of step. Returns the changes doing so"""
+        self._replaying = replayed = []
+        try:
+            for change in reversed(step):
+                _revertChange(change)
+        finally:
+            self._replaying = None
+        return replayed
+
+
+def _revertChange(change):
+    node = change.node
+    t = type(change)
+    if t is SetChange:
+        node._change(change.removed, change.added)
+        return
+
+    with node._noNotify():
+        if t is ListSplice:
+            node._splice(change.index, len(change.inserted), change.removed)
+        elif t is ListMove:
+            node._move(change.toIndex, change.fromIndex)
+        elif t is DictSet:
+            node._setChild(change.key, change.old)
+        elif t is AttrSet:
+            node._setChild(change.name, change.old)
+        else:
+            raise TypeError("Unknown change %r" % (change,))
+
+    if t is DictSet:
+        node.notify(change.key)
+    elif t is AttrSet:
+        node.notify(change.name)
+    else:
+        node.notify()
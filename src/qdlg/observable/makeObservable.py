@@ -14,26 +14,32 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from .ObservableBase import ObservableBase, isObservable
+from copy import deepcopy
 
 
-_immutableTypes = {int, str, bytes, bool, float}
-_unsupportedTypes = {bytearray}
-_iterableType = {list, tuple}
+_immutableTypes = {int, str, bytes, bool, float, frozenset}
 
 
 def isImmutable(obj):
-    return type(obj) in _immutableTypes or obj is None or callable(obj)
+    t = type(obj)
+    if t is tuple:
+        return all(isImmutable(v) for v in obj)
+    return t in _immutableTypes or obj is None or callable(obj)
 
 
-def makeObservable(obj, *, parent):
+def makeObservable(obj, *, parent, lazy=False):
+    """Wrap obj into an observable.
+
+    With lazy=True, nested containers are kept unwrapped and each container is
+    wrapped on its first access instead, so making a big structure observable
+    doesn't allocate a wrapper per node upfront. Don't modify obj directly after
+    wrapping it either way.
+    """
     from .ObservableObject import ObservableObject
-    from .ObservableList import ObservableList
+    from .ObservableList import ObservableList, ObservableByteArray
     from .ObservableDict import ObservableDict
-
-    if type(obj) in _unsupportedTypes:
-        raise RuntimeError(
-            "Object %s of type %s is not yet made observable." % (obj, type(obj))
-        )
+    from .ObservableSet import ObservableSet
+    from .ObservableTuple import ObservableTuple
 
     if isinstance(obj, ObservableBase):
         assert obj._parent is parent
@@ -42,17 +48,68 @@ def makeObservable(obj, *, parent):
     if isImmutable(obj):
         return obj
 
-    if type(obj) in _iterableType:
-        return ObservableList(obj, parent=parent)
+    t = type(obj)
+    if t is list:
+        return ObservableList(obj, parent=parent, lazy=lazy)
+
+    if t is dict:
+        return ObservableDict(obj, parent=parent, lazy=lazy)
+
+    if t is tuple:
+        return ObservableTuple(obj, parent=parent, lazy=lazy)
+
+    if t is set:
+        return ObservableSet(obj, parent=parent, lazy=lazy)
+
+    if t is bytearray:
+        return ObservableByteArray(obj, parent=parent, lazy=lazy)
+
+    return ObservableObject(obj, parent=parent, lazy=lazy)
+
+
+def isUnwrapped(obj):
+    """Whether obj is a child container left unwrapped in lazy mode"""
+    return not isinstance(obj, ObservableBase) and not isImmutable(obj)
+
+
+def adoptChild(obj, *, parent):
+    """Make obj a child of parent, wrapping it unless parent is lazy"""
+    if parent._lazy and not isinstance(obj, ObservableBase):
+        return obj
+    return makeObservable(obj, parent=parent, lazy=parent._lazy)
 
-    if type(obj) is dict:
-        return ObservableDict(obj, parent=parent)
 
-    return ObservableObject(obj, parent=parent)
+def wrapChildAt(parent, key):
+    """Get parent._obj[key], wrapping it first if it's left unwrapped"""
+    item = parent._obj[key]
+    if isUnwrapped(item):
+        item = makeObservable(item, parent=parent, lazy=True)
+        parent._obj[key] = item
+    return item
 
 
 def unobserved(obj):
     if isinstance(obj, ObservableBase):
         return obj.unobserved()
+    elif isObservable(obj):  # Checked second, as it's slower for plain values
+        return obj.unobserved()
+    else:
+        return obj
+
+
+def unobservedChild(obj):
+    """unobserved() for children, which may be unwrapped containers in lazy mode"""
+    if isinstance(obj, ObservableBase):
+        return obj.unobserved()
+    elif isImmutable(obj):
+        return obj
+    return deepcopy(obj)
+
+
+def snapshot(obj):
+    if isinstance(obj, ObservableBase):
+        return obj.snapshot()
+    elif isObservable(obj):  # Checked second, as it's slower for plain values
+        return obj.snapshot()
     else:
         return obj
@@ -0,0 +1,184 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .ObservableBase import ObservableBase
+from .handle import ObserverHandle, WeakHandler, removeFirst
+from .scheduler import getScheduler
+
+
+class ObservableRef:
+    """Stand-in for an observable that can be pointed to another one later.
+
+    Reads, writes and method calls go to the current target. Observable
+    children are returned as references too, following their parent, so
+    bindings made to ref["child"] move along as well. Observers registered
+    through references are moved on retarget(), and run once as the value
+    they observe changed.
+    """
+
+    __slots__ = ("_target", "_parent", "_key", "_children", "_registrations")
+    _observable = True
+
+    def __init__(self, target, *, parent=None, key=None):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_key", key)  # (key, is attribute)
+        object.__setattr__(self, "_children", {})
+        object.__setattr__(self, "_registrations", ())
+
+    def retarget(self, target):
+        assert self._parent is None, "only root references can be retargeted"
+        if target is self._target:
+            return
+
+        object.__setattr__(self, "_target", target)
+        handlers = []
+        self._rebind(handlers)
+
+        scheduler = getScheduler()
+        scheduler.enter()
+        try:
+            for handler in handlers:
+                scheduler.schedule(handler)
+        finally:
+            scheduler.exit()
+        scheduler.notified()
+
+    def _rebind(self, handlers):
+        try:
+            target = self._resolve()
+        except (KeyError, IndexError, AttributeError):  # Path gone in new target
+            target = None
+
+        for r in self._registrations:
+            r.bind(target)
+            handlers.append(r.handler)
+        for child in self._children.values():
+            child._rebind(handlers)
+
+    def _resolve(self):
+        parent = self._parent
+        if parent is None:
+            return self._target
+
+        key, isAttribute = self._key
+        if isAttribute:
+            return getattr(parent._resolve(), key)
+        return parent._resolve()[key]
+
+    def _wrap(self, value, key, isAttribute):
+        """Reference to child value at key, if it's observable"""
+        if not isinstance(value, ObservableBase):
+            return value
+
+        try:
+            return self._children[key, isAttribute]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable key, like slices
+            return value
+
+        child = ObservableRef(None, parent=self, key=(key, isAttribute))
+        self._children[key, isAttribute] = child
+        return child
+
+    def registerObserver(self, handler, *, weak=False):
+        return self._register(None, handler, weak)
+
+    def subscribe(self, path, handler, *, weak=False):
+        return self._register(path, handler, weak)
+
+    def _register(self, path, handler, weak):
+        handle = ObserverHandle(None)
+        if weak:
+            handler = WeakHandler(handler, handle.dispose)
+
+        registration = _Registration(path, handler)
+        registration.bind(self._resolve())
+        object.__setattr__(
+            self, "_registrations", self._registrations + (registration,)
+        )
+
+        def remove():
+            registration.bind(None)
+            object.__setattr__(
+                self,
+                "_registrations",
+                removeFirst(self._registrations, registration),
+            )
+
+        handle._remove = remove
+        return handle
+
+    # Forwarding
+
+    def __getattr__(self, name):
+        return self._wrap(getattr(self._resolve(), name), name, True)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __getitem__(self, key):
+        return self._wrap(self._resolve()[key], key, False)
+
+    def __setitem__(self, key, value):
+        self._resolve()[key] = value
+
+    def __delitem__(self, key):
+        del self._resolve()[key]
+
+    def __contains__(self, item):
+        return item in self._resolve()
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __eq__(self, obj):
+        if isinstance(obj, ObservableRef):
+            obj = obj._resolve()
+        return self._resolve() == obj
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self._resolve())
+
+    def __repr__(self):
+        return "ref(%r)" % (self._resolve(),)
+
+
+class _Registration:
+    __slots__ = ("path", "handler", "_handle")
+
+    def __init__(self, path, handler):
+        self.path = path
+        self.handler = handler
+        self._handle = None
+
+    def bind(self, target):
+        """Register handler to target instead, or just unregister if it's None"""
+        if self._handle is not None:
+            self._handle.dispose()
+            self._handle = None
+
+        if target is None:
+            return
+        if self.path is None:
+            self._handle = target.registerObserver(self.handler)
+        else:
+            self._handle = target.subscribe(self.path, self.handler)
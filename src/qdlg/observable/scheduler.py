@@ -0,0 +1,217 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Schedulers decide when observers run after a change.
+
+Observable operations call enter() and exit() around their work, and
+schedule(handler) for each observer to run. Top-level notify() calls
+notified() when it's done. Handlers scheduled more than once before being run
+are run once.
+"""
+
+
+class SyncScheduler:
+    """Run observers right away, inside the changing call"""
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def schedule(self, handler):
+        handler()
+
+    def notified(self):
+        pass
+
+    def flush(self):
+        pass
+
+
+class QueuedScheduler:
+    """Base class for schedulers running observers later, each once per flush"""
+
+    def __init__(self):
+        self._queue = {}
+        self._flushing = False
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def schedule(self, handler):
+        # Keyed by id so that unhashable callables work too. The queue holds
+        # the handler, so its id can't be reused while it's queued.
+        self._queue[id(handler)] = handler
+        self._requestFlush()
+
+    def _requestFlush(self):
+        raise NotImplementedError
+
+    def notified(self):
+        pass
+
+    def flush(self):
+        """Run queued observers, including the ones they queue in turn"""
+        if self._flushing:
+            return
+
+        queue = self._queue
+        self._flushing = True
+        try:
+            while queue:
+                # Pop one by one, so that a raising handler doesn't drop the rest
+                handler = queue.pop(next(iter(queue)))
+                handler()
+        finally:
+            self._flushing = False
+
+
+class MicrotaskScheduler(QueuedScheduler):
+    """Run observers once the outermost observable operation returns.
+
+    Use batch() to also coalesce observers across several operations.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._depth = 0
+
+    def enter(self):
+        self._depth += 1
+
+    def exit(self):
+        self._depth -= 1
+
+    def _requestFlush(self):
+        pass
+
+    def notified(self):
+        if self._depth == 0:
+            self.flush()
+
+    def batch(self):
+        return _Batch(self)
+
+
+class _Batch:
+    def __init__(self, scheduler):
+        self._scheduler = scheduler
+
+    def __enter__(self):
+        self._scheduler.enter()
+        return self._scheduler
+
+    def __exit__(self, *exc):
+        self._scheduler.exit()
+        self._scheduler.notified()
+        return False
+
+
+class QtIdleScheduler(QueuedScheduler):
+    """Run observers on the next Qt event loop iteration.
+
+    With debounceMs, observers run only once no change happened for that long,
+    so typing into a bound LineEdit doesn't redraw dependents on every key.
+    """
+
+    def __init__(self, debounceMs=0):
+        from aqt.qt import QTimer
+
+        super().__init__()
+        self._debounceMs = debounceMs
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def _requestFlush(self):
+        if self._debounceMs or not self._timer.isActive():
+            self._timer.start(self._debounceMs)
+
+
+class QtThreadScheduler(QueuedScheduler):
+    """Allow changing observables from worker threads.
+
+    Every observable operation holds one lock shared by all threads, and
+    observers run on the Qt GUI thread, coalesced into batches: once per
+    intervalMs at most. Use batch() to hold the lock across several
+    operations, for example to read a consistent state from a worker.
+    Create it on the GUI thread.
+    """
+
+    def __init__(self, intervalMs=0):
+        from aqt.qt import QTimer, Qt
+        import threading
+
+        super().__init__()
+        self._lock = threading.RLock()
+        self._posted = False
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(intervalMs)
+        self._timer.timeout.connect(self.flush)
+        self._poster = _makePoster()
+        self._poster.posted.connect(
+            self._timer.start, Qt.ConnectionType.QueuedConnection
+        )
+
+    def enter(self):
+        self._lock.acquire()
+
+    def exit(self):
+        self._lock.release()
+
+    def schedule(self, handler):
+        # Called inside enter(), so the queue is guarded by the lock
+        self._queue[id(handler)] = handler
+        if not self._posted:
+            self._posted = True
+            self._poster.posted.emit()
+
+    def flush(self):
+        with self._lock:
+            self._posted = False
+            super().flush()
+
+    def batch(self):
+        return _Batch(self)
+
+
+def _makePoster():
+    from aqt.qt import QObject, pyqtSignal
+
+    class Poster(QObject):
+        posted = pyqtSignal()
+
+    return Poster()
+
+
+_current = SyncScheduler()
+
+
+def getScheduler():
+    return _current
+
+
+def setScheduler(scheduler):
+    """Set the scheduler used by every observable. Returns the previous one."""
+    global _current
+    previous = _current
+    _current.flush()
+    _current = scheduler
+    return previous
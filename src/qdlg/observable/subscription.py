@@ -0,0 +1,122 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .handle import removeFirst
+
+# Marks a change of the whole node, as opposed to a change of one of its keys
+wholeNode = object()
+
+
+def normalizePath(path):
+    """Turn "a" into ("a",) and ["a", 0, "b"] into ("a", 0, "b")"""
+    if type(path) is list:
+        return tuple(path)
+    return (path,)
+
+
+class SubscriptionTrie:
+    """Subscribers of an observable node, keyed by the path they observe"""
+
+    __slots__ = ("callbacks", "children", "_childKeys")
+
+    def __init__(self):
+        self.callbacks = []
+        self.children = {}
+        self._childKeys = {}  # id(child node) -> key it was last found at
+
+    def add(self, path, callback):
+        trie = self
+        for key in path:
+            child = trie.children.get(key)
+            if child is None:
+                child = trie.children[key] = SubscriptionTrie()
+            trie = child
+        trie.callbacks.append(callback)
+
+    def remove(self, path, callback):
+        trie = self
+        tries = []
+        for key in path:
+            tries.append((trie, key))
+            trie = trie.children.get(key)
+            if trie is None:
+                return
+        trie.callbacks = removeFirst(trie.callbacks, callback)
+
+        # Prune emptied tries, so that dispatch doesn't scan their keys anymore
+        for parent, key in reversed(tries):
+            child = parent.children[key]
+            if child.callbacks or child.children:
+                break
+            del parent.children[key]
+
+    def dispatch(self, node, chain, key, schedule):
+        """Run callbacks affected by a change.
+
+        chain is a linked list (child, (grandchild, ... None)) of nodes from node
+        down to the changed node, and key is the key changed on the changed node,
+        or wholeNode. Callbacks are passed to schedule().
+        """
+        trie = self
+        self._fire(schedule)
+
+        while chain is not None:
+            child, chain = chain
+            trie = trie._childTrie(node, child)
+            if trie is None:
+                return
+            trie._fire(schedule)
+            node = child
+
+        if key is wholeNode:
+            for childTrie in trie.children.values():
+                childTrie._fireAll(schedule)
+        else:
+            try:
+                childTrie = trie.children.get(key)
+            except TypeError:  # Unhashable key
+                return
+            if childTrie is not None:
+                childTrie._fireAll(schedule)
+
+    def _childTrie(self, node, child):
+        # Children don't know their key, and list indexes shift. Remember where
+        # each child was found, and only scan the subscribed keys when it moved.
+        childKeys = self._childKeys
+        try:
+            key = childKeys[id(child)]
+            trie = self.children[key]
+        except KeyError:
+            pass
+        else:
+            if node._childAt(key) is child:
+                return trie
+
+        for key, trie in self.children.items():
+            if node._childAt(key) is child:
+                if len(childKeys) >= len(self.children):
+                    childKeys.clear()  # Drop entries of replaced children
+                childKeys[id(child)] = key
+                return trie
+        return None
+
+    def _fire(self, schedule):
+        for callback in self.callbacks:
+            schedule(callback)
+
+    def _fireAll(self, schedule):
+        self._fire(schedule)
+        for trie in self.children.values():
+            trie._fireAll(schedule)
@@ -0,0 +1,45 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .subscription import wholeNode
+
+# Read sets of the computations currently running, innermost last.
+# Checked as `if readStack:` on read paths, so reads cost next to nothing
+# while no computation is running.
+readStack = []
+
+
+def recordRead(node, key=wholeNode):
+    try:
+        hash(key)
+    except TypeError:  # Slices and such
+        key = wholeNode
+    readStack[-1][(id(node), key)] = node
+
+
+class trackReads:
+    """Collect (node, key) pairs read by observables inside the block"""
+
+    def __enter__(self):
+        self.reads = {}
+        readStack.append(self.reads)
+        return self
+
+    def __exit__(self, *exc):
+        readStack.pop()
+        return False
+
+    def dependencies(self):
+        return [(node, key) for (_, key), node in self.reads.items()]
@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from .tracking import readStack, recordRead
+
 
 def bind(instance, func, as_name=None):
     """
@@ -30,6 +32,9 @@ def bind(instance, func, as_name=None):
 
 def _forwardMethod(key, callHandlersAfter):
     def _(self, *args, **kwargs):
+        if readStack and not callHandlersAfter:
+            recordRead(self)
+
         with self._noNotify():
             ret = getattr(self._obj, key)(*args, **kwargs)
 
@@ -15,11 +15,56 @@
 
 from aqt.qt import QDialog, QVBoxLayout, Qt
 
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
+
 from .stack import pushQDlgStack, popQDlgStack, qDlgStackGetDialog
 from .utils import addLayoutOrWidget
+from .observable import isObservable, snapshot
+from .observable.diff import freezeKey
+from .observable.ref import ObservableRef
+from .styleSheet import PendingStyles
+
+# (_QDlg, key of the non-observable arguments) -> _CachedDialog, oldest first
+_dialogCache = OrderedDict()
+_dialogCacheSize = 8
+
+
+def setDialogCacheSize(size):
+    """Set how many cached dialogs are kept, evicting the least recently used"""
+    global _dialogCacheSize
+    _dialogCacheSize = size
+    _trimDialogCache()
+
+
+# Result of runAsync(). models holds snapshots of the observable arguments.
+DialogResult = namedtuple("DialogResult", "accepted models")
+
+# Dialogs shown by runAsync(), kept alive until closed
+_openDialogs = set()
+
+
+class _CachedDialog:
+    __slots__ = ("dlg", "refs", "running")
+
+    def __init__(self, dlg, refs):
+        self.dlg = dlg
+        self.refs = refs
+        self.running = False
+
+
+def QDlg(title, size=None, *, cached=False):
+    """Decorate a function building the contents of a dialog.
 
+    With cached=True, the dialog built by the first run() is kept and shown
+    again by later runs with equal non-observable arguments. Observable
+    arguments are passed to the constructor as references, pointed to the
+    observables of each run, so bound widgets show and edit the current ones.
+    State not bound to a model, like unbound LineEdit texts, is kept between
+    runs. Runs with arguments that can't be compared by value, like unhashable
+    objects, aren't cached.
+    """
 
-def QDlg(title, size=None):
     class _QDlg:
         def __init__(self, constructor):
             self.constructor = constructor
@@ -30,26 +75,159 @@ def QDlg(title, size=None):
             Args:
                 onClose(accepted): Function to run on close. Defaults to None.
             """
+            entry = self._prepare(args, kwargs)
+            entry.running = True
+            try:
+                return self._exec(entry.dlg)
+            finally:
+                entry.running = False
+
+        def runAsync(self, *args, **kwargs):
+            """Show dialog without blocking, unlike run().
+
+            Returns a concurrent.futures.Future resolving to a DialogResult once
+            the dialog closes. Use future.add_done_callback() for a callback, or
+            asyncio.wrap_future() to await it from an asyncio loop running on
+            Qt, like qasync.
+            """
+            entry = self._prepare(args, kwargs)
+            dlg = entry.dlg
+            models = _observableArguments(args, kwargs)
+            future = Future()
+            future.set_running_or_notify_cancel()
+
+            def onFinished(result):
+                dlg.finished.disconnect(onFinished)
+                _openDialogs.discard(dlg)
+                entry.running = False
+                future.set_result(
+                    DialogResult(
+                        result == QDialog.Accepted, [_finalState(m) for m in models]
+                    )
+                )
+
+            entry.running = True
+            _openDialogs.add(dlg)  # Keep it alive until closed
+            dlg.finished.connect(onFinished)
+            self._show(dlg)
+            dlg.open()
+            return future
+
+        def _prepare(self, args, kwargs):
+            """Build the dialog, or get it from the cache"""
+            if not cached:
+                return _CachedDialog(self._build(args, kwargs), [])
+
+            try:
+                key = (self, _argumentsKey(args, kwargs))
+            except TypeError:  # An id() could be reused by a later argument
+                return _CachedDialog(self._build(args, kwargs), [])
+
+            entry = _dialogCache.get(key)
+            if entry is None or entry.running:
+                args, kwargs, refs = _referenceArguments(args, kwargs)
+                dlg = self._build(args, kwargs)
+                entry = _CachedDialog(dlg, refs)
+                if key not in _dialogCache:
+                    _dialogCache[key] = entry
+                    _trimDialogCache()
+            else:
+                _dialogCache.move_to_end(key)
+                for ref, target in zip(entry.refs, _observableArguments(args, kwargs)):
+                    ref.retarget(target)
+                entry.dlg.setResult(0)
+            return entry
+
+        def invalidate(self):
+            """Drop the cached dialogs, so that the next run() rebuilds"""
+            for key in [key for key in _dialogCache if key[0] is self]:
+                _evict(key)
+
+        def _build(self, args, kwargs):
             dlg = QDialog()
             dlg.setWindowFlags(dlg.windowFlags() & ~Qt.WindowContextHelpButtonHint)
             dlg.setWindowTitle(title)
+            dlg.setUpdatesEnabled(False)
 
+            # Widgets are collected in layouts without a parent widget, so
+            # adding them doesn't relayout or polish anything. Installing the
+            # layout at the end reparents the whole tree in one pass.
             layout = QVBoxLayout()
             layout.setContentsMargins(10, 10, 10, 10)
             self.layout = layout
-            dlg.setLayout(layout)
+            self.pendingStyles = PendingStyles()
 
             pushQDlgStack(self)
             self.constructor(dlg, *args, **kwargs)
             popQDlgStack(self)
 
+            dlg.setLayout(layout)
+            self.pendingStyles.install(dlg)
+            self.pendingStyles = None
+            dlg.setUpdatesEnabled(True)
+            return dlg
+
+        def _exec(self, dlg):
+            self._show(dlg)
+            dlg.show()
+            return dlg.exec_() == QDialog.Accepted
+
+        def _show(self, dlg):
             dlg.setWindowModality(Qt.WindowModal)
             if size:
                 dlg.resize(size[0], size[1])
-            dlg.show()
-            return dlg.exec_() == QDialog.Accepted
 
         def addChild(self, child):
             addLayoutOrWidget(self.layout, child)
 
     return _QDlg
+
+
+def _argumentsKey(args, kwargs):
+    def key(arg):
+        return ObservableRef if isObservable(arg) else freezeKey(arg, strict=True)
+
+    return (
+        tuple(key(arg) for arg in args),
+        tuple((name, key(kwargs[name])) for name in sorted(kwargs)),
+    )
+
+
+def _observableArguments(args, kwargs):
+    values = list(args) + [kwargs[name] for name in sorted(kwargs)]
+    return [v for v in values if isObservable(v)]
+
+
+def _finalState(model):
+    try:
+        return snapshot(model)
+    except NotImplementedError:  # Objects have no snapshot
+        return model
+
+
+def _referenceArguments(args, kwargs):
+    """Replace observable arguments with references to them"""
+    refs = []
+
+    def reference(arg):
+        if not isObservable(arg):
+            return arg
+        ref = ObservableRef(arg)
+        refs.append(ref)
+        return ref
+
+    args = [reference(arg) for arg in args]
+    kwargs = {name: reference(kwargs[name]) for name in sorted(kwargs)}
+    return args, kwargs, refs
+
+
+def _trimDialogCache():
+    for key in list(_dialogCache)[: max(len(_dialogCache) - _dialogCacheSize, 0)]:
+        _evict(key)
+
+
+def _evict(key):
+    entry = _dialogCache.pop(key)
+    if not entry.running:
+        # Destroying the widgets also disposes their model bindings
+        entry.dlg.deleteLater()
@@ -0,0 +1,72 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .observable.ObservableBase import observableVersion
+
+
+class RenderCache:
+    """Memoize renderer(item) across repeated renders of the same data.
+
+    Entries are keyed by item identity, or by key(item) if given, and stamped
+    with the observable version of the item. An entry is reused only while the
+    item hasn't fired a change since it was rendered.
+
+    Entries not rendered during a pass are dropped on prune(), so the cache
+    never holds more than one pass worth of items.
+    """
+
+    def __init__(self, renderer, key=None):
+        self._renderer = renderer
+        self._key = key
+        self._entries = {}
+        self._fresh = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, item):
+        key = id(item) if self._key is None else self._key(item)
+        version = observableVersion(item)
+
+        entry = self._fresh.get(key)
+        if entry is None:
+            entry = self._entries.get(key)
+
+        # Entry holds a reference to the item, so id(item) can't be recycled
+        # while the entry is alive.
+        if (
+            entry is not None
+            and entry[1] == version
+            and (entry[0] is item or entry[0] == item)
+        ):
+            self.hits += 1
+            self._fresh[key] = entry
+            return entry[2]
+
+        self.misses += 1
+        text = self._renderer(item)
+        self._fresh[key] = (item, version, text)
+        return text
+
+    def prune(self):
+        """Drop entries that weren't rendered since the last prune()"""
+        self._entries = self._fresh
+        self._fresh = {}
+
+    def clear(self):
+        self._entries = {}
+        self._fresh = {}
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
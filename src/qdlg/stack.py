@@ -41,3 +41,21 @@ def qDlgStackTop():
 
 def qDlgStackGetDialog():
     return getQDlgStack()[0]
+
+
+def enclosingContainers():
+    """Containers being built, innermost first.
+
+    A container built again later, like a Dynamic section, keeps the ones that
+    enclosed it when it was created in its `enclosing` attribute.
+    """
+    containers = getQDlgStack()
+    while True:
+        for container in reversed(containers):
+            yield container
+            enclosing = getattr(container, "enclosing", None)
+            if enclosing is not None:
+                containers = enclosing
+                break
+        else:
+            return
@@ -0,0 +1,117 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Stylesheets shared through the dialog root.
+
+Setting a stylesheet on a widget makes Qt parse it and re-polish the widget,
+so styling many widgets with the same string repeats that work for each one.
+Instead, every distinct style becomes a class named after the hash of its
+content. Widgets get the class as a dynamic property, and a single stylesheet
+with one rule per class is installed on the root widget of the dialog. As with
+a stylesheet set on the widget, a rule applies to its child widgets too.
+"""
+
+import hashlib
+
+styleProperty = "qdlgStyle"
+
+# style text -> (class name, rule), or None for complete stylesheets
+_compiled = {}
+
+
+def compileStyle(style):
+    """Return (class name, rule) for style, or None if it can't be shared.
+
+    Styles with their own selectors apply to children of the widget too, and
+    can't be scoped to a class. Those are still set on the widget itself.
+    """
+    try:
+        return _compiled[style]
+    except KeyError:
+        pass
+
+    if "{" in style:
+        entry = None
+    else:
+        name = "s" + hashlib.sha1(style.encode("utf-8")).hexdigest()[:12]
+        selector = '*[%s="%s"]' % (styleProperty, name)
+        entry = (name, "%s, %s * { %s }" % (selector, selector, style))
+    _compiled[style] = entry
+    return entry
+
+
+def installStyleRules(root, rules):
+    """Add rules to the stylesheet of root. Returns whether any was new.
+
+    Rules are looked up in the current stylesheet, so the ones dropped by a
+    later setStyleSheet() call are installed again.
+    """
+    sheet = root.styleSheet()
+    new = [rule for rule in dict.fromkeys(rules) if rule not in sheet]
+    if not new:
+        return False
+
+    root.setStyleSheet("\n".join([sheet, *new] if sheet else new))
+    return True
+
+
+class PendingStyles:
+    """Styles set while a dialog or section is being built"""
+
+    def __init__(self):
+        self._rules = {}
+        self._sheets = []
+
+    def add(self, widget, style):
+        entry = compileStyle(style)
+        if entry is None:
+            self._sheets.append((widget, style))
+        else:
+            name, rule = entry
+            widget.setProperty(styleProperty, name)
+            self._rules[rule] = None
+
+    def install(self, root):
+        """Install the collected styles once root holds the built widgets"""
+        installStyleRules(root, self._rules)
+        for widget, style in self._sheets:
+            widget.setStyleSheet(style)
+
+
+def applyStyle(widget, style):
+    """Style a widget that is already part of a built dialog"""
+    entry = compileStyle(style)
+    if entry is None:
+        widget.setStyleSheet(style)
+        return
+
+    name, rule = entry
+    widget.setProperty(styleProperty, name)
+    if not installStyleRules(widget.window(), [rule]):
+        repolish(widget)
+
+
+def repolish(widget):
+    """Re-evaluate selectors on widget and its children.
+
+    Qt doesn't watch dynamic properties, so this is needed after changing the
+    style class of a widget without changing any stylesheet.
+    """
+    from aqt.qt import QWidget
+
+    for w in [widget, *widget.findChildren(QWidget)]:
+        qstyle = w.style()
+        qstyle.unpolish(w)
+        qstyle.polish(w)
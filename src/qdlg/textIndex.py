@@ -0,0 +1,173 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Text lookups over changing sets of labels"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+
+def _trigrams(text):
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Case-insensitive substring search over labels, using a trigram index.
+
+    Labels are counted, so duplicates are fine. update() takes the complete
+    new list of labels and only indexes the ones that weren't there before.
+    """
+
+    def __init__(self):
+        self._counts = {}  # lowercase label -> number of occurrences
+        self._postings = {}  # trigram -> set of lowercase labels containing it
+        self._lastQuery = None
+        self._lastResult = None
+
+    def __len__(self):
+        return len(self._counts)
+
+    def update(self, labels):
+        """Make the index hold exactly labels"""
+        newCounts = {}
+        for label in labels:
+            label = label.lower()
+            newCounts[label] = newCounts.get(label, 0) + 1
+
+        oldCounts = self._counts
+        for label in oldCounts:
+            if label not in newCounts:
+                self._unindex(label)
+        for label in newCounts:
+            if label not in oldCounts:
+                self._index(label)
+
+        self._counts = newCounts
+        self._lastQuery = None
+
+    def _index(self, label):
+        postings = self._postings
+        for gram in _trigrams(label):
+            try:
+                postings[gram].add(label)
+            except KeyError:
+                postings[gram] = {label}
+
+    def _unindex(self, label):
+        postings = self._postings
+        for gram in _trigrams(label):
+            labels = postings[gram]
+            labels.discard(label)
+            if not labels:
+                del postings[gram]
+
+    def search(self, query):
+        """Set of lowercase labels containing query"""
+        query = query.lower()
+        if not query:
+            return set(self._counts)
+
+        lastQuery = self._lastQuery
+        if lastQuery is not None and lastQuery in query:
+            # Typing further only narrows down the previous matches
+            candidates = self._lastResult
+        elif len(query) >= 3:
+            candidates = None
+            for gram in sorted(_trigrams(query), key=self._postingSize):
+                labels = self._postings.get(gram)
+                if not labels:
+                    candidates = set()
+                    break
+                candidates = set(labels) if candidates is None else candidates & labels
+        else:
+            candidates = self._counts
+
+        result = {label for label in candidates if query in label}
+        self._lastQuery = query
+        self._lastResult = result
+        return result
+
+    def _postingSize(self, gram):
+        return len(self._postings.get(gram, ()))
+
+
+class PrefixIndex:
+    """Labels sorted case-insensitively, for prefix lookups with bisect"""
+
+    def __init__(self, labels=()):
+        self.update(labels)
+
+    def update(self, labels):
+        pairs = sorted((label.lower(), label) for label in labels)
+        self._keys = [k for k, _ in pairs]
+        self._labels = [label for _, label in pairs]
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __getitem__(self, i):
+        return self._labels[i]
+
+    def add(self, label):
+        key = label.lower()
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._labels.insert(i, label)
+
+    def remove(self, label):
+        key = label.lower()
+        keys = self._keys
+        for i in range(bisect_left(keys, key), bisect_right(keys, key)):
+            if self._labels[i] == label:
+                del keys[i]
+                del self._labels[i]
+                return
+        raise KeyError(label)
+
+    def replace(self, removed, added):
+        """Remove some labels and add others.
+
+        Each add() or remove() shifts the sorted lists, so for more than a few
+        labels, sorting everything again is faster.
+        """
+        removed = list(removed)
+        added = list(added)
+        if len(removed) + len(added) <= 32 + len(self._labels) // 64:
+            for label in removed:
+                self.remove(label)
+            for label in added:
+                self.add(label)
+            return
+
+        counts = Counter(removed)
+        kept = []
+        for label in self._labels:
+            if counts[label]:
+                counts[label] -= 1
+            else:
+                kept.append(label)
+        for label, count in counts.items():
+            if count:
+                raise KeyError(label)
+        self.update(kept + added)
+
+    def range(self, prefix):
+        """(start, stop) indices of the labels starting with prefix"""
+        prefix = prefix.lower()
+        keys = self._keys
+        start = bisect_left(keys, prefix)
+        # No lowercase label continues past the highest code point
+        stop = bisect_left(keys, prefix + "\U0010ffff", start)
+        return start, stop
@@ -34,3 +34,26 @@ def continuationHelper(getter, setter):
             return self
 
     return _
+
+
+def sameFunction(a, b):
+    """Whether a and b are the same function, or the same code run again.
+
+    A builder defines new lambdas every time it runs. They count as the same if
+    they capture the same values.
+    """
+    if a is b or a == b:  # Equal bound methods
+        return True
+    code = getattr(a, "__code__", None)
+    if code is None or code is not getattr(b, "__code__", None):
+        return False
+    if a.__defaults__ != b.__defaults__ or a.__kwdefaults__ != b.__kwdefaults__:
+        return False
+    for cellA, cellB in zip(a.__closure__ or (), b.__closure__ or ()):
+        try:
+            x, y = cellA.cell_contents, cellB.cell_contents
+        except ValueError:  # Empty cell
+            return False
+        if x is not y and x != y:
+            return False
+    return True
@@ -15,18 +15,25 @@
 
 from ..stack import qDlgStackTop
 from .Style import StylableWidget
+from .Keyable import Keyable
 from .Shortcutable import Shortcutable
 
 from aqt.qt import QPushButton, QKeySequence
 
 
-class Button(StylableWidget, Shortcutable):
+class Button(StylableWidget, Shortcutable, Keyable):
     def __init__(self, label):
         super().__init__()
         self.widget = QPushButton(label)
         self.widget.setAutoDefault(False)
         qDlgStackTop().addChild(self.widget)
 
+    def _updateFrom(self, new):
+        super()._updateFrom(new)
+        text = new.widget.text()
+        if self.widget.text() != text:
+            self.widget.setText(text)
+
     def onClick(self, callback):
         self.widget.clicked.connect(callback)
         return self
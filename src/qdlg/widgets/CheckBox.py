@@ -17,12 +17,13 @@ from ..stack import qDlgStackTop
 from ..utils import continuationHelper
 from ..modelHandler import configureModel
 from .Style import StylableWidget
+from .Keyable import Keyable
 from .Shortcutable import Shortcutable
 
 from aqt.qt import QCheckBox
 
 
-class CheckBox(StylableWidget, Shortcutable):
+class CheckBox(StylableWidget, Shortcutable, Keyable):
     def __init__(self, initialEnabled=False):
         super().__init__()
         self.widget = QCheckBox()
@@ -39,5 +40,7 @@ class CheckBox(StylableWidget, Shortcutable):
     )
 
     def model(self, obj, *, attr=None, index=None):
-        configureModel(obj, self.onChange, self.checked, attr=attr, index=index)
+        configureModel(
+            obj, self.onChange, self.checked, attr=attr, index=index, owner=self.widget
+        )
         return self
@@ -0,0 +1,301 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from ..stack import qDlgStackTop
+from ..utils import sameFunction
+from ..observable import isObservable
+from ..observable.ObservableBase import ObservableBase
+from ..observable.changes import ListSplice, ListMove
+from .Style import StylableWidget
+from .Keyable import Keyable
+
+from aqt.qt import (
+    QAbstractItemView,
+    QAbstractTableModel,
+    QHeaderView,
+    QModelIndex,
+    QSortFilterProxyModel,
+    QTableView,
+    Qt,
+)
+
+
+def _defaultRenderer(value):
+    return "" if value is None else str(value)
+
+
+class Column:
+    """Column of a DataGrid.
+
+    key is the dict key or attribute name of the shown field, or a function
+    getting the value from a record. It defaults to title. renderer turns the
+    value into the shown text. Rows are sorted by sortKey(value), or by the
+    value itself if it's a number or a string, or else by the text.
+    """
+
+    def __init__(
+        self, title, key=None, *, renderer=_defaultRenderer, sortKey=None, width=None
+    ):
+        self.title = title
+        self.key = title if key is None else key
+        self.renderer = renderer
+        self.sortKey = sortKey
+        self.width = width
+
+    def sameAs(self, other):
+        """Whether other shows the same, like a column built again"""
+        return (
+            self.title == other.title
+            and self.width == other.width
+            and all(
+                sameFunction(a, b)
+                for a, b in [
+                    (self.key, other.key),
+                    (self.renderer, other.renderer),
+                    (self.sortKey, other.sortKey),
+                ]
+            )
+        )
+
+    def value(self, record):
+        key = self.key
+        if callable(key):
+            return key(record)
+        try:
+            return record[key]
+        except KeyError:
+            return None
+        except TypeError:  # Objects
+            return getattr(record, key, None)
+
+
+class _RecordTableModel(QAbstractTableModel):
+    """Table model over a list of records, following its change records.
+
+    Rows are kept in a list of their own, updated along the change records, so
+    that the model is consistent between each begin/end call pair even for
+    the intermediate states of a reassigned list.
+
+    Change records only come for the observed list and what's below it, but
+    observing it makes every observable check its ancestors for observers on
+    each change.
+    """
+
+    def __init__(self, data, columns):
+        super().__init__()
+        self._data = data
+        self._columns = columns
+        self._rows = list(data)
+        self._rowOf = None  # id(record) -> row, rebuilt after rows shift
+
+    def observe(self):
+        data = self._data
+        if isinstance(data, ObservableBase):
+            return data.observeChanges(self._onChange)
+        elif isObservable(data):  # References don't relay change records
+            return data.registerObserver(self._reset)
+        return None
+
+    def setColumns(self, columns):
+        self.beginResetModel()
+        self._columns = columns
+        self.endResetModel()
+
+    def record(self, row):
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole and role != Qt.UserRole:
+            return None
+
+        column = self._columns[index.column()]
+        value = column.value(self._rows[index.row()])
+        if role == Qt.DisplayRole:
+            return column.renderer(value)
+
+        if column.sortKey is not None:
+            return column.sortKey(value)
+        if type(value) in (int, float, str):
+            return value
+        return column.renderer(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._columns[section].title
+        return None
+
+    def _reset(self):
+        self.beginResetModel()
+        self._rows = list(self._data)
+        self._rowOf = None
+        self.endResetModel()
+
+    def _onChange(self, change):
+        rows = self._rows
+        node = change.node
+        if node is self._data:
+            if type(change) is ListSplice:
+                self._splice(change.index, len(change.removed), change.inserted)
+            elif type(change) is ListMove:
+                self._move(change.fromIndex, change.toIndex)
+            return
+
+        # Change inside a record: find the record holding the changed node
+        while node is not None and node._parent is not self._data:
+            node = node._parent
+        if node is None:
+            return
+        rowOf = self._rowOf
+        if rowOf is None:
+            rowOf = self._rowOf = {id(record): row for row, record in enumerate(rows)}
+        row = rowOf.get(id(node))
+        if row is not None and rows[row] is node:
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, len(self._columns) - 1)
+            )
+
+    def _splice(self, index, removeCount, inserted):
+        rows = self._rows
+        if removeCount == len(inserted):  # Replaced in place
+            rowOf = self._rowOf
+            if rowOf is not None:
+                for row in range(index, index + removeCount):
+                    rowOf.pop(id(rows[row]), None)
+                    rowOf[id(inserted[row - index])] = row
+            rows[index : index + removeCount] = inserted
+            if removeCount:
+                self.dataChanged.emit(
+                    self.index(index, 0),
+                    self.index(index + removeCount - 1, len(self._columns) - 1),
+                )
+            return
+
+        self._rowOf = None  # Rows after index shift
+        if removeCount:
+            self.beginRemoveRows(QModelIndex(), index, index + removeCount - 1)
+            del rows[index : index + removeCount]
+            self.endRemoveRows()
+        if inserted:
+            self.beginInsertRows(QModelIndex(), index, index + len(inserted) - 1)
+            rows[index:index] = inserted
+            self.endInsertRows()
+
+    def _move(self, fromIndex, toIndex):
+        if fromIndex == toIndex:
+            return
+        # Qt takes the destination as the row to insert before, prior to the move
+        destination = toIndex + 1 if toIndex > fromIndex else toIndex
+        self.beginMoveRows(
+            QModelIndex(), fromIndex, fromIndex, QModelIndex(), destination
+        )
+        self._rows.insert(toIndex, self._rows.pop(fromIndex))
+        self._rowOf = None
+        self.endMoveRows()
+
+
+class DataGrid(StylableWidget, Keyable):
+    """Table of records, like the dicts or objects of an observable list.
+
+    Only visible cells are rendered, and changes to the list update the
+    affected rows only, so large lists stay fast.
+    """
+
+    def __init__(self, data, columns):
+        super().__init__()
+        self._columns = [c if isinstance(c, Column) else Column(c) for c in columns]
+        self._model = _RecordTableModel(data, self._columns)
+
+        self._proxy = QSortFilterProxyModel()
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setSortRole(Qt.UserRole)
+        self._proxy.setFilterKeyColumn(-1)
+        self._proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        self.widget = QTableView()
+        self.widget.setModel(self._proxy)
+        self.widget.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.widget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.widget.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.widget.verticalHeader().hide()
+        self._applyWidths()
+
+        self._modelHandle = self._model.observe()
+        if self._modelHandle is not None:
+            self._modelHandle.disposeWith(self.widget)
+
+        qDlgStackTop().addChild(self.widget)
+
+    def _applyWidths(self):
+        for i, column in enumerate(self._columns):
+            if column.width is not None:
+                self.widget.setColumnWidth(i, column.width)
+
+    def _updateFrom(self, new):
+        super()._updateFrom(new)
+        data = new._model._data
+        old = self._model._data
+        columnsChanged = len(new._columns) != len(self._columns) or not all(
+            a.sameAs(b) for a, b in zip(self._columns, new._columns)
+        )
+
+        if data is not old and (isObservable(data) or data != old):
+            if self._modelHandle is not None:
+                self._modelHandle.dispose()
+            self._columns = new._columns
+            self._model = _RecordTableModel(data, self._columns)
+            self._proxy.setSourceModel(self._model)
+            self._modelHandle = self._model.observe()
+            if self._modelHandle is not None:
+                self._modelHandle.disposeWith(self.widget)
+        elif columnsChanged:
+            self._columns = new._columns
+            self._model.setColumns(self._columns)
+        else:
+            return
+        self._applyWidths()
+
+    def sortable(self, enabled=True):
+        self.widget.setSortingEnabled(enabled)
+        return self
+
+    def filter(self, text):
+        """Show only rows with text in any of their cells"""
+        self._proxy.setFilterFixedString(text)
+        return self
+
+    def multiselect(self, enabled=True):
+        if enabled:
+            self.widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        else:
+            self.widget.setSelectionMode(QAbstractItemView.SingleSelection)
+        return self
+
+    def selected(self):
+        """Selected records, in the shown order"""
+        rows = self.widget.selectionModel().selectedRows()
+        rows.sort(key=lambda index: index.row())
+        return [self._model.record(self._proxy.mapToSource(i).row()) for i in rows]
+
+    def onSelect(self, callback):
+        self.widget.selectionModel().selectionChanged.connect(
+            lambda *args: callback(self.selected())
+        )
+        return self
@@ -0,0 +1,185 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from ..stack import qDlgStackTop, getQDlgStack, pushQDlgStack, popQDlgStack
+from ..container import QDlgContainer
+from ..observable.diff import matchKeys
+from ..styleSheet import PendingStyles
+
+from aqt.qt import QWidget, QLayout, QVBoxLayout
+
+
+class Dynamic(QDlgContainer):
+    """Section rebuilt by builder() whenever one of deps changes.
+
+    Widgets placed directly in the section and given a key() are matched with
+    the ones of the previous build by type and key. The previous ones are kept
+    with their state, and take the content and style of the new ones. Other
+    widgets are replaced, and dropped widgets are deleted, which disposes
+    their model bindings.
+    """
+
+    def __init__(self, builder, deps=()):
+        self._builder = builder
+        self._entries = []
+        self._building = None
+        self._keyed = None
+        self.pendingStyles = None
+        # Containers that rebuilt widgets still belong to, like a RadioGroup
+        self.enclosing = tuple(getQDlgStack())
+
+        self.widget = QWidget()
+        self.layout = QVBoxLayout()
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.widget.setLayout(self.layout)
+        qDlgStackTop().addChild(self.widget)
+
+        for dep in deps:
+            dep.registerObserver(self.rebuild).disposeWith(self.widget)
+
+        self._entries = self._build()
+        for entry in self._entries:
+            for child in entry.children:
+                _addToLayout(self.layout, child)
+
+    def addChild(self, child):
+        self._building.append(child)
+        return self
+
+    def addKeyed(self, keyable, key):
+        """Called by Keyable.key() for widgets placed directly in the section"""
+        self._keyed[id(keyable)] = (keyable, key)
+
+    def _build(self):
+        """Run the builder. Returns its children grouped into _Entry objects"""
+        self._building = []
+        self._keyed = {}
+        self.pendingStyles = PendingStyles()
+        pushQDlgStack(self)
+        try:
+            self._builder()
+        finally:
+            popQDlgStack(self)
+        children, self._building = self._building, None
+        keyed, self._keyed = self._keyed, None
+
+        # A keyable may add several children, like the filter box of a ListBox.
+        # Ones placed in a nested container aren't keyed.
+        childIds = {id(child) for child in children}
+        keyedEntries = {}
+        for keyable, key in keyed.values():
+            widgets = keyable._widgets()
+            if all(id(w) in childIds for w in widgets):
+                entry = _Entry((type(keyable), key), keyable, widgets)
+                for w in widgets:
+                    keyedEntries[id(w)] = entry
+
+        entries = []
+        placed = set()
+        for child in children:
+            entry = keyedEntries.get(id(child))
+            if entry is None:
+                entries.append(_Entry(object(), None, (child,)))
+            elif id(entry) not in placed:
+                placed.add(id(entry))
+                entries.append(entry)
+        return entries
+
+    def rebuild(self):
+        widget = self.widget
+        widget.setUpdatesEnabled(False)
+        try:
+            built = self._build()
+            # Only used when rebuilt outside of the dialog construction. Done
+            # first, so that kept widgets can take the styles of new ones.
+            self.pendingStyles.install(widget.window())
+            self.pendingStyles = None
+            self._reconcile(built)
+        finally:
+            widget.setUpdatesEnabled(True)
+
+    def _reconcile(self, built):
+        old = self._entries
+        matches, _ = matchKeys([e.key for e in old], [e.key for e in built])
+        newToOld = {j: i for i, j in matches.items()}
+
+        result = []
+        for j, entry in enumerate(built):
+            i = newToOld.get(j)
+            if i is None:
+                result.append(entry)
+            else:
+                kept = old[i]
+                kept.keyable._updateFrom(entry.keyable)
+                result.append(kept)
+                for child in entry.children:
+                    _discard(child)  # Never shown, so deleting it is cheap
+
+        for i, entry in enumerate(old):
+            if i not in matches:
+                for child in entry.children:
+                    _removeFromLayout(self.layout, child)
+                    _discard(child)
+
+        # Place children, leaving the ones already in place untouched
+        layout = self.layout
+        children = [child for entry in result for child in entry.children]
+        for i, child in enumerate(children):
+            if _itemContent(layout.itemAt(i)) is not child:
+                _removeFromLayout(layout, child)
+                _addToLayout(layout, child, i)
+
+        self._entries = result
+
+
+class _Entry:
+    """Children added by one keyed widget, or a single unkeyed child"""
+
+    __slots__ = ("key", "keyable", "children")
+
+    def __init__(self, key, keyable, children):
+        self.key = key  # (type, key) of keyed widgets, or a key matching nothing
+        self.keyable = keyable
+        self.children = children
+
+
+def _itemContent(item):
+    if item is None:
+        return None
+    return item.widget() or item.layout()
+
+
+def _addToLayout(layout, child, index=-1):
+    if isinstance(child, QLayout):
+        layout.insertLayout(index, child)
+    else:
+        layout.insertWidget(index, child)
+
+
+def _removeFromLayout(layout, child):
+    for i in range(layout.count()):
+        if _itemContent(layout.itemAt(i)) is child:
+            layout.takeAt(i)
+            return
+
+
+def _discard(child):
+    if isinstance(child, QLayout):
+        while child.count():
+            _discard(_itemContent(child.takeAt(0)))
+        child.deleteLater()
+    elif child is not None:
+        child.setParent(None)
+        child.deleteLater()
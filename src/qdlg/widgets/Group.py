@@ -24,9 +24,13 @@ class Group(QDlgContainer):
     def __init__(self, title: str):
         self.groupBox = QGroupBox(title)
         self.layout = QVBoxLayout()
-        self.groupBox.setLayout(self.layout)
         qDlgStackTop().addChild(self.groupBox)
 
     def addChild(self, child):
         addLayoutOrWidget(self.layout, child)
         return self
+
+    def __exit__(self, *exc):
+        # Set last, so that children are reparented all at once
+        self.groupBox.setLayout(self.layout)
+        return super().__exit__(*exc)
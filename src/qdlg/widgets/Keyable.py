@@ -0,0 +1,54 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from ..stack import getQDlgStack
+from ..styleSheet import styleProperty, repolish
+
+
+class Keyable:
+    def key(self, key):
+        """Identify this widget across rebuilds of a Dynamic section.
+
+        Only applies to widgets placed directly in the section. A rebuild keeps
+        the previous widget of the same type and key, with its state, bindings
+        and callbacks, and updates its content and style from the new one.
+        """
+        stack = getQDlgStack()
+        addKeyed = getattr(stack[-1], "addKeyed", None) if stack else None
+        if addKeyed is not None:
+            addKeyed(self, key)
+        return self
+
+    def _widgets(self):
+        """Widgets this added to its container"""
+        return (self.widget,)
+
+    def _updateFrom(self, new):
+        """Show what new shows, when kept instead of it by a rebuild"""
+        for widget, newWidget in zip(self._widgets(), new._widgets()):
+            _copyStyle(widget, newWidget)
+
+
+def _copyStyle(widget, newWidget):
+    changed = False
+    style = newWidget.property(styleProperty)
+    if widget.property(styleProperty) != style:
+        widget.setProperty(styleProperty, style)
+        changed = True
+    sheet = newWidget.styleSheet()
+    if widget.styleSheet() != sheet:
+        widget.setStyleSheet(sheet)  # Repolishes
+    elif changed:
+        repolish(widget)
@@ -16,12 +16,110 @@
 from ..stack import qDlgStackTop
 from ..utils import continuationHelper
 from ..modelHandler import configureModel
+from ..observable import isObservable
+from ..observable.ObservableBase import ObservableBase
+from ..observable.changes import ListSplice, ListMove
+from ..textIndex import PrefixIndex
 from .Style import StylableWidget
+from .Keyable import Keyable
 
-from aqt.qt import QLineEdit
+from aqt.qt import QLineEdit, QCompleter, QAbstractListModel, QModelIndex, Qt
 
 
-class LineEdit(StylableWidget):
+class _CompletionModel(QAbstractListModel):
+    """Labels of a PrefixIndex starting with the typed prefix.
+
+    Rows map to a range of the sorted labels, so narrowing down costs two
+    bisections, and the popup only renders visible rows.
+    """
+
+    def __init__(self, source, key):
+        super().__init__()
+        self._source = source
+        self._key = key
+        self._labels = {}  # id(item) -> label, for items that change inside
+        self._index = PrefixIndex(self._label(item) for item in source)
+        self._start = self._stop = 0
+
+    def observe(self):
+        source = self._source
+        if isinstance(source, ObservableBase):
+            return source.observeChanges(self._onChange)
+        elif isObservable(source):  # References don't relay change records
+            return source.registerObserver(self._rebuild)
+        return None
+
+    def setPrefix(self, prefix):
+        self.beginResetModel()
+        if prefix:
+            self._start, self._stop = self._index.range(prefix)
+        else:
+            self._start = self._stop = 0
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._stop - self._start
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return self._index[self._start + index.row()]
+        return None
+
+    def _label(self, item):
+        label = self._key(item)
+        if isinstance(item, ObservableBase):
+            self._labels[id(item)] = label
+        return label
+
+    def _forget(self, item):
+        """Label item was indexed with"""
+        if isinstance(item, ObservableBase):
+            label = self._labels.pop(id(item), None)
+            if label is not None:
+                return label
+        return self._key(item)
+
+    def _rebuild(self):
+        self.beginResetModel()
+        self._labels = {}
+        self._index.update(self._label(item) for item in self._source)
+        self._start = self._stop = 0
+        self.endResetModel()
+
+    def _onChange(self, change):
+        node = change.node
+        if node is not self._source:
+            # Change inside an item: find the item holding the changed node
+            while node is not None and node._parent is not self._source:
+                node = node._parent
+            old = None if node is None else self._labels.get(id(node))
+            if old is None:
+                self._rebuild()
+                return
+            new = self._key(node)
+            if new != old:
+                self._labels[id(node)] = new
+                self.beginResetModel()
+                self._index.replace([old], [new])
+                self._start = self._stop = 0
+                self.endResetModel()
+            return
+        if type(change) is ListMove:
+            return
+        if type(change) is not ListSplice:
+            self._rebuild()
+            return
+
+        self.beginResetModel()
+        self._index.replace(
+            [self._forget(item) for item in change.removed],
+            [self._label(item) for item in change.inserted],
+        )
+        self._start = self._stop = 0
+        self.endResetModel()
+
+
+class LineEdit(StylableWidget, Keyable):
     def __init__(self, initialText=""):
         super().__init__()
         self.widget = QLineEdit()
@@ -53,6 +151,36 @@ class LineEdit(StylableWidget):
         self.widget.editingFinished.connect(lambda: callback(self.text()))
         return self
 
+    def completions(self, source, *, key=str):
+        """Suggest items of source starting with the typed text.
+
+        source is a list of candidates, usually observable, and key(item) gives
+        the text of an item. Changes to source update the suggestions.
+        """
+        model = _CompletionModel(source, key)
+        handle = model.observe()
+        if handle is not None:
+            handle.disposeWith(self.widget)
+
+        completer = QCompleter(model, self.widget)
+        completer.setWidget(self.widget)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        completer.popup().setUniformItemSizes(True)
+        completer.activated[str].connect(self.widget.setText)
+
+        def onEdited(text):
+            model.setPrefix(text)
+            if model.rowCount():
+                completer.complete()
+            else:
+                completer.popup().hide()
+
+        self.widget.textEdited.connect(onEdited)
+        self._completer = completer
+        return self
+
     def model(self, obj, *, attr=None, index=None):
-        configureModel(obj, self.onInput, self.text, attr=attr, index=index)
+        configureModel(
+            obj, self.onInput, self.text, attr=attr, index=index, owner=self.widget
+        )
         return self
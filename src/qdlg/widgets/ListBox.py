@@ -14,33 +14,92 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from ..stack import qDlgStackTop
-from ..utils import addLayoutOrWidget, continuationHelper
+from ..utils import addLayoutOrWidget, continuationHelper, sameFunction
 from ..container import QDlgContainer
 from ..observable import isObservable
 from ..modelHandler import configureModel
+from ..renderCache import RenderCache
+from ..textIndex import SearchIndex
 from .Style import StylableWidget
+from .Keyable import Keyable
 
-from aqt.qt import QListWidget, QListWidgetItem, Qt, QPoint, QAbstractItemView
+from aqt.qt import (
+    QListWidget,
+    QListWidgetItem,
+    QLineEdit,
+    Qt,
+    QPoint,
+    QAbstractItemView,
+)
 
 from typing import Union, List, Any
 
 
-class ListBox(StylableWidget):
-    def __init__(self, data, *, renderer=lambda x: x):
+class ListBox(StylableWidget, Keyable):
+    def __init__(self, data, *, renderer=lambda x: x, filterable=False):
         super().__init__()
         self.widget = QListWidget()
         self._data = data
         self._renderer = renderer
+        self._renderCache = None
 
         self._multiselect = False
         self._sorted = False
 
+        # With filterable, a filter box above the list hides non-matching rows
+        self._searchIndex = None
+        self._filterText = ""
+        self._shownLabels = None
+        self._labelItems = {}
+        self.filterEdit = None
+        if filterable:
+            self._searchIndex = SearchIndex()
+            self.filterEdit = QLineEdit()
+            self.filterEdit.setPlaceholderText("Filter")
+            self.filterEdit.textChanged.connect(self.filter)
+            qDlgStackTop().addChild(self.filterEdit)
+
+        self._dataHandle = None
         if isObservable(data):
-            data.registerObserver(self._refillData)
+            self._dataHandle = data.registerObserver(self._refillData)
+            self._dataHandle.disposeWith(self.widget)
 
         self._refillData()
         qDlgStackTop().addChild(self.widget)
 
+    def _widgets(self):
+        if self.filterEdit is None:
+            return (self.widget,)
+        return (self.filterEdit, self.widget)
+
+    def _updateFrom(self, new):
+        super()._updateFrom(new)
+        refill = False
+
+        newCache = new._renderCache
+        if not sameFunction(self._renderer, new._renderer):
+            self._renderer = new._renderer
+            self._renderCache = None  # Rendered with the previous renderer
+            refill = True
+        if (newCache is None) != (self._renderCache is None):
+            self._renderCache = (
+                None if newCache is None else RenderCache(self._renderer, newCache._key)
+            )
+
+        data = new._data
+        if data is not self._data and (isObservable(data) or data != self._data):
+            if self._dataHandle is not None:
+                self._dataHandle.dispose()
+                self._dataHandle = None
+            self._data = data
+            if isObservable(data):
+                self._dataHandle = data.registerObserver(self._refillData)
+                self._dataHandle.disposeWith(self.widget)
+            refill = True
+
+        if refill:
+            self._refillData()
+
     def _refillData(self):
         widget = self.widget
 
@@ -60,15 +119,24 @@ class ListBox(StylableWidget):
         elif not self._multiselect:
             oldSelect = [oldSelect]
 
+        renderCache = self._renderCache
+        renderer = self._renderer if renderCache is None else renderCache.render
+
         widget.clear()
         for d in self._data:
             item = QListWidgetItem()
-            item.setText(self._renderer(d))
+            item.setText(renderer(d))
             item.setData(Qt.UserRole, d)
             widget.addItem(item)
             if d in oldSelect:
                 item.setSelected(True)
 
+        if renderCache is not None:
+            renderCache.prune()
+
+        if self._searchIndex is not None:
+            self._reindex()
+
         if self._sorted:
             widget.sortItems()
 
@@ -93,6 +161,55 @@ class ListBox(StylableWidget):
         if len(widget.selectedItems()) != len(oldSelect):
             self.widget.itemSelectionChanged.emit()
 
+    def _reindex(self):
+        labelItems = {}
+        widget = self.widget
+        for row in range(widget.count()):
+            item = widget.item(row)
+            label = item.text().lower()
+            try:
+                labelItems[label].append(item)
+            except KeyError:
+                labelItems[label] = [item]
+
+        self._labelItems = labelItems
+        self._searchIndex.update(labelItems)
+        self._shownLabels = None  # New items are all shown
+        self.filter(self._filterText)
+
+    def filter(self, text):
+        """Show only rows containing text, case-insensitively.
+
+        Only rows changing visibility are touched, so narrowing down a filter
+        costs in proportion to the rows it hides.
+        """
+        if self._searchIndex is None:
+            self._searchIndex = SearchIndex()
+            self._filterText = text
+            self._reindex()  # Applies the filter too
+            return self
+
+        self._filterText = text
+        shown = self._searchIndex.search(text)
+        previous = self._shownLabels
+        labelItems = self._labelItems
+        if previous is None:
+            toHide = labelItems.keys() - shown
+            toShow = ()
+        else:
+            toHide = previous - shown
+            toShow = shown - previous
+
+        for label in toHide:
+            for item in labelItems[label]:
+                item.setHidden(True)
+        for label in toShow:
+            for item in labelItems[label]:
+                item.setHidden(False)
+
+        self._shownLabels = shown
+        return self
+
     def select(self, newValues=None):
         widget = self.widget
 
@@ -130,7 +247,9 @@ class ListBox(StylableWidget):
         return self
 
     def model(self, obj, *, attr=None, index=None):
-        configureModel(obj, self.onSelect, self.select, attr=attr, index=index)
+        configureModel(
+            obj, self.onSelect, self.select, attr=attr, index=index, owner=self.widget
+        )
         return self
 
     # QListWidget properties
@@ -145,6 +264,24 @@ class ListBox(StylableWidget):
         self._multiselect = enabled != QListWidget.SingleSelection
         return self
 
+    def renderCache(self, enabled=True, *, key=None):
+        """Reuse rendered labels of items that haven't changed since last refill.
+
+        Items are matched by identity, or by key(item) if given. Observable items
+        are re-rendered only after they fire a change.
+        """
+        if enabled:
+            self._renderCache = RenderCache(self._renderer, key)
+        else:
+            self._renderCache = None
+        return self
+
+    def renderCacheStats(self):
+        """Hit/miss counters of the render cache, or None if it's disabled"""
+        if self._renderCache is None:
+            return None
+        return self._renderCache.stats()
+
     def sorted(self, enabled=True):
         self._sorted = enabled
         self._refillData()
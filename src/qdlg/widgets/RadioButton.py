@@ -13,15 +13,17 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from ..stack import qDlgStackTop
+from ..stack import qDlgStackTop, enclosingContainers
 from ..utils import continuationHelper
+from ..container import QDlgContainer
 from ..modelHandler import configureModel
 from .Style import StylableWidget
+from .Keyable import Keyable
 
-from aqt.qt import QRadioButton
+from aqt.qt import QRadioButton, QButtonGroup
 
 
-class RadioButton(StylableWidget):
+class RadioButton(StylableWidget, Keyable):
     def __init__(self, title: str, value=None, initialEnabled=False):
         super().__init__()
         self.widget = QRadioButton(title)
@@ -32,8 +34,28 @@ class RadioButton(StylableWidget):
             self.value = title
         else:
             self.value = value
+
+        self._group = None
+        for container in enclosingContainers():
+            if isinstance(container, RadioGroup):
+                self._group = container
+                container.addButton(self)
+                break
         qDlgStackTop().addChild(self.widget)
 
+    def _updateFrom(self, new):
+        super()._updateFrom(new)
+        self.title = new.title
+        if self._group is not None:
+            # new took over the value when it joined the group
+            self._group.removeButton(new)
+            self.value = new.value
+            self._group.updateButton(self)
+        else:
+            self.value = new.value
+        if self.widget.text() != new.title:
+            self.widget.setText(new.title)
+
     def onChange(self, callback):
         self.widget.toggled.connect(callback)
         return self
@@ -56,5 +78,141 @@ class RadioButton(StylableWidget):
             if value == self.value:
                 self.checked(True)
 
-        configureModel(obj, self.onSelect, setter, attr=attr, index=index)
+        configureModel(
+            obj, self.onSelect, setter, attr=attr, index=index, owner=self.widget
+        )
+        return self
+
+
+class RadioGroup(QDlgContainer):
+    """Radio buttons sharing one QButtonGroup and one model binding.
+
+    Buttons anywhere inside it join the group, and are laid out in their
+    enclosing container as usual. This includes buttons built again by a
+    Dynamic section inside it, which take over the value of the ones they
+    replace.
+
+    with RadioGroup().model(obj, attr="selection"):
+        RadioButton("Item 1", value=1)
+        RadioButton("Item 2", value=2)
+    """
+
+    def __init__(self):
+        self._parent = qDlgStackTop()
+        self.group = QButtonGroup()
+        self._ids = {}  # value -> button id
+        self._values = {}  # button id -> value
+        self._nextId = 0
+        self._open = False  # Inside the with block
+        self._selected = None  # Value last selected by the user or the model
+        self._callbacks = []
+        self._binding = None
+        self._pressedId = -1  # Checked button when the click started
+        self.group.idPressed.connect(self._onPressed)
+        self.group.idClicked.connect(self._onClicked)
+
+    def addButton(self, button):
+        value = button.value
+        if self._open and value in self._ids:
+            raise ValueError("Duplicate RadioGroup value %r" % (value,))
+        buttonId = self._nextId
+        self._nextId += 1
+        self.group.addButton(button.widget, buttonId)
+        self._values[buttonId] = value
+        self._ids[value] = buttonId
+        # Also keeps the group alive as long as any of its buttons
+        button.widget.destroyed.connect(lambda *args: self._forget(buttonId))
+        if not self._open and value is not None and value == self._selected:
+            button.widget.setChecked(True)
+
+    def removeButton(self, button):
+        buttonId = self.group.id(button.widget)
+        if buttonId != -1:
+            self.group.removeButton(button.widget)
+            self._forget(buttonId)
+
+    def updateButton(self, button):
+        """Register the new value of button"""
+        buttonId = self.group.id(button.widget)
+        if buttonId == -1:
+            return
+        self._forget(buttonId)
+        self._values[buttonId] = button.value
+        self._ids[button.value] = buttonId
+
+    def _forget(self, buttonId):
+        value = self._values.pop(buttonId, None)
+        if self._ids.get(value) == buttonId:
+            del self._ids[value]
+
+    def addChild(self, child):
+        self._parent.addChild(child)
+        return self
+
+    def __enter__(self):
+        self._open = True
+        return super().__enter__()
+
+    def __exit__(self, *exc):
+        ret = super().__exit__(*exc)
+        self._open = False
+        if self._binding is not None:
+            obj, attr, index = self._binding
+            self._binding = None
+            self.model(obj, attr=attr, index=index)
+        return ret
+
+    def _onPressed(self, buttonId):
+        # Mouse, space key and arrow keys all press the button before clicking
+        self._pressedId = self.group.checkedId()
+
+    def _onClicked(self, buttonId):
+        if buttonId == self._pressedId:  # Clicked the checked button
+            return
+        value = self._values[buttonId]
+        self._selected = value
+        for callback in self._callbacks:
+            callback(value)
+
+    def onChange(self, callback):
+        """Call callback(value) once per selection by the user"""
+        self._callbacks.append(callback)
+        return self
+
+    def selected(self):
+        """Value of the checked button, or None"""
+        buttonId = self.group.checkedId()
+        return None if buttonId == -1 else self._values[buttonId]
+
+    def select(self, value):
+        self._selected = value
+        buttonId = self._ids.get(value)
+        button = None if buttonId is None else self.group.button(buttonId)
+        if button is not None:
+            button.setChecked(True)
+        else:  # Uncheck all
+            checked = self.group.checkedButton()
+            if checked is not None:
+                self.group.setExclusive(False)
+                checked.setChecked(False)
+                self.group.setExclusive(True)
+        return self
+
+    def model(self, obj, *, attr=None, index=None):
+        """Bind the selected value to obj.attr or obj[index].
+
+        Called before the buttons are added, binds once they are.
+        """
+        if not self._values:
+            self._binding = (obj, attr, index)
+            return self
+
+        configureModel(
+            obj,
+            self.onChange,
+            self.select,
+            attr=attr,
+            index=index,
+            owner=self.group,
+        )
         return self
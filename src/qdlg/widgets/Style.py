@@ -14,13 +14,20 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
-class StylableWidget:
-    def style(self, style: str):
-        self.widget.setStyleSheet(style)
-        return self
+from ..stack import getQDlgStack
+from ..styleSheet import applyStyle
 
 
-class StylableLayout:
+def setStyleSheet(widget, style):
+    """Style widget now, or once the dialog being built is complete"""
+    stack = getQDlgStack()
+    if stack:
+        stack[0].pendingStyles.add(widget, style)
+    else:
+        applyStyle(widget, style)
+
+
+class StylableWidget:
     def style(self, style: str):
-        self.layout.setStyleSheet(str)
+        setStyleSheet(self.widget, style)
         return self
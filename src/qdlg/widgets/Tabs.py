@@ -0,0 +1,101 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from ..stack import qDlgStackTop, pushQDlgStack, popQDlgStack
+from ..utils import addLayoutOrWidget
+from ..container import QDlgContainer
+from ..styleSheet import PendingStyles
+
+from aqt.qt import QTabWidget, QWidget, QVBoxLayout
+
+
+class Tabs(QDlgContainer):
+    """Tab widget whose pages are built when first shown.
+
+    with Tabs():
+        @Page("General")
+        def _():
+            CheckBox()...
+    """
+
+    def __init__(self):
+        self.widget = QTabWidget()
+        self._pages = []
+        self.widget.currentChanged.connect(self._onCurrentChanged)
+        qDlgStackTop().addChild(self.widget)
+
+    def addChild(self, child):
+        raise RuntimeError("Tabs can only contain Page")
+
+    def addPage(self, page):
+        self._pages.append(page)
+        self.widget.addTab(page.widget, page.title)
+
+    def __exit__(self, *exc):
+        ret = super().__exit__(*exc)
+        self._onCurrentChanged(self.widget.currentIndex())
+        return ret
+
+    def _onCurrentChanged(self, index):
+        if 0 <= index < len(self._pages):
+            self._pages[index].build()
+
+
+class _Page(QDlgContainer):
+    def __init__(self, title, builder):
+        self.title = title
+        self._builder = builder
+        self.pendingStyles = None
+        self.widget = QWidget()
+        self.layout = QVBoxLayout()
+        self.widget.setLayout(self.layout)
+
+    def build(self):
+        """Run the builder, unless it has already run"""
+        builder = self._builder
+        if builder is None:
+            return
+        self._builder = None
+
+        self.pendingStyles = PendingStyles()
+        self.widget.setUpdatesEnabled(False)
+        pushQDlgStack(self)
+        try:
+            builder()
+        finally:
+            popQDlgStack(self)
+            # Only used when built after the dialog construction
+            self.pendingStyles.install(self.widget.window())
+            self.pendingStyles = None
+            self.widget.setUpdatesEnabled(True)
+
+    def addChild(self, child):
+        addLayoutOrWidget(self.layout, child)
+        return self
+
+
+def Page(title, builder=None):
+    """Add a page to the enclosing Tabs, built by builder() when first shown.
+
+    Without builder, returns a decorator taking it.
+    """
+
+    def register(builder):
+        qDlgStackTop().addPage(_Page(title, builder))
+        return builder
+
+    if builder is None:
+        return register
+    register(builder)
@@ -15,16 +15,23 @@
 
 from ..stack import qDlgStackTop
 from .Style import StylableWidget
+from .Keyable import Keyable
 
 from aqt.qt import QLabel
 
 
-class Text(StylableWidget):
+class Text(StylableWidget, Keyable):
     def __init__(self, text):
         super().__init__()
         self.widget = QLabel(text)
         qDlgStackTop().addChild(self.widget)
 
+    def _updateFrom(self, new):
+        super()._updateFrom(new)
+        text = new.widget.text()
+        if self.widget.text() != text:
+            self.widget.setText(text)
+
     def wordWrap(self, enabled):
         self.widget.setWordWrap(enabled)
         return self
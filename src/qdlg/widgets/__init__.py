@@ -19,7 +19,10 @@ from .Text import Text  # NOQA
 from .Button import Button  # NOQA
 from .LineEdit import LineEdit  # NOQA
 from .CheckBox import CheckBox  # NOQA
-from .RadioButton import RadioButton  # NOQA
+from .RadioButton import RadioButton, RadioGroup  # NOQA
 from .ListBox import ListBox  # NOQA
 from .Table import Table, Tr, Td  # NOQA
+from .DataGrid import DataGrid, Column  # NOQA
 from .Group import Group  # NOQA
+from .Dynamic import Dynamic  # NOQA
+from .Tabs import Tabs, Page  # NOQA
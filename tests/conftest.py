@@ -0,0 +1,159 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Opt-in benchmark support.
+
+Tests marked with @pytest.mark.benchmark are skipped unless pytest runs with
+--run-benchmarks. They time code through the bench fixture, and fail when
+it's slower than the saved baseline by more than --regression-threshold.
+Baselines are machine specific: refresh them with --save-baseline. `npm run
+test:bench` runs them.
+"""
+
+import gc
+import json
+import os
+import time
+
+import pytest
+
+_baselinePath = os.path.join(
+    os.path.dirname(__file__), "test_observable", "benchmark_baseline.json"
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("qdlg benchmarks")
+    group.addoption("--run-benchmarks", action="store_true", help="run benchmark tests")
+    group.addoption(
+        "--save-baseline",
+        action="store_true",
+        help="store the benchmark results as the new baseline",
+    )
+    group.addoption(
+        "--regression-threshold",
+        type=float,
+        default=0.5,
+        help="allowed slowdown over the baseline, as a fraction (default 0.5)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: opt-in performance test")
+    config._benchResults = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+
+    skip = pytest.mark.skip(reason="benchmark, use --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    results = config._benchResults
+    if not results or not config.getoption("--save-baseline"):
+        return
+
+    baseline = _loadBaseline()
+    baseline.update(results)
+    with open(_baselinePath, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _loadBaseline():
+    try:
+        with open(_baselinePath) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+class _Bench:
+    def __init__(self, request):
+        self._config = request.config
+        self._name = request.node.name
+
+    def __call__(self, fn, *, minTime=0.2, maxRounds=100):
+        """Time fn(). Returns the best time of a single call in seconds.
+
+        Fast functions are called repeatedly in each round, as timeit does, to
+        get above the timer resolution. fn should leave its inputs as it found
+        them, as every call is timed.
+        """
+        number = 1
+        while self._time(fn, number) < 1e-3 and number < 1e6:
+            number *= 10
+
+        best = float("inf")
+        rounds = 0
+        spent = 0.0
+        while rounds < maxRounds and (rounds < 3 or spent < minTime):
+            elapsed = self._time(fn, number)
+            best = min(best, elapsed / number)
+            spent += elapsed
+            rounds += 1
+
+        self._config._benchResults[self._name] = {"seconds": best, "rounds": rounds}
+        self._check(best)
+        return best
+
+    @staticmethod
+    def _time(fn, number):
+        # Collections would land in random rounds, so leave them out as timeit does
+        gcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            return time.perf_counter() - start
+        finally:
+            if gcEnabled:
+                gc.enable()
+
+    def _check(self, seconds):
+        if self._config.getoption("--save-baseline"):
+            return
+
+        config = self._config
+        if not hasattr(config, "_benchBaseline"):
+            config._benchBaseline = _loadBaseline()
+        expected = config._benchBaseline.get(self._name)
+        if expected is None:
+            return
+
+        threshold = config.getoption("--regression-threshold")
+        limit = expected["seconds"] * (1 + threshold)
+        if seconds > limit:
+            pytest.fail(
+                "%s took %.3g ms, baseline %.3g ms (+%d%% allowed)"
+                % (
+                    self._name,
+                    seconds * 1e3,
+                    expected["seconds"] * 1e3,
+                    threshold * 100,
+                )
+            )
+
+
+@pytest.fixture
+def bench(request):
+    return _Bench(request)
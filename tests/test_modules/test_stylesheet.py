@@ -0,0 +1,73 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+
+sys.path.insert(
+    1, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src/qdlg"))
+)
+
+from styleSheet import compileStyle, installStyleRules, styleProperty  # NOQA
+
+
+class Root:
+    """Just the parts of QWidget used by installStyleRules"""
+
+    def __init__(self, sheet=""):
+        self.sheet = sheet
+        self.setCount = 0
+
+    def styleSheet(self):
+        return self.sheet
+
+    def setStyleSheet(self, sheet):
+        self.sheet = sheet
+        self.setCount += 1
+
+
+def test_compile_dedup():
+    name, rule = compileStyle("color: red;")
+    assert compileStyle("color: red;") == (name, rule)
+    assert compileStyle("color: blue;")[0] != name
+    selector = '*[%s="%s"]' % (styleProperty, name)
+    assert rule == "%s, %s * { color: red; }" % (selector, selector)
+
+
+def test_compile_complete_sheet():
+    assert compileStyle("QPushButton { margin: 5px; }") is None
+
+
+def test_install_rules():
+    root = Root("QDialog { padding: 1px; }")
+    red = compileStyle("color: red;")[1]
+    blue = compileStyle("color: blue;")[1]
+
+    assert installStyleRules(root, [red, red])
+    assert root.sheet == "QDialog { padding: 1px; }\n" + red
+    assert not installStyleRules(root, [red])
+    assert installStyleRules(root, [red, blue])
+    assert root.sheet.split("\n") == ["QDialog { padding: 1px; }", red, blue]
+    assert root.setCount == 2
+
+
+def test_install_rules_after_sheet_replaced():
+    root = Root()
+    red = compileStyle("color: red;")[1]
+    installStyleRules(root, [red])
+
+    root.setStyleSheet("QDialog { padding: 1px; }")
+    assert installStyleRules(root, [red])
+    assert root.sheet == "QDialog { padding: 1px; }\n" + red
@@ -0,0 +1,123 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    1, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src/qdlg"))
+)
+
+from textIndex import SearchIndex, PrefixIndex  # NOQA
+
+
+def test_search():
+    index = SearchIndex()
+    index.update(["Default", "Japanese::Vocab", "Japanese::Kanji", "German"])
+    assert index.search("") == {
+        "default",
+        "japanese::vocab",
+        "japanese::kanji",
+        "german",
+    }
+    assert index.search("jap") == {"japanese::vocab", "japanese::kanji"}
+    assert index.search("japanese::k") == {"japanese::kanji"}
+    assert index.search("an") == {"japanese::vocab", "japanese::kanji", "german"}
+    assert index.search("xyz") == set()
+    assert index.search("KANJI") == {"japanese::kanji"}
+
+
+def test_update():
+    index = SearchIndex()
+    index.update(["a deck", "b deck", "b deck"])
+    assert index.search("deck") == {"a deck", "b deck"}
+    index.update(["b deck", "c deck"])
+    assert index.search("deck") == {"b deck", "c deck"}
+    assert index.search("a d") == set()
+    assert len(index) == 2
+
+
+def _deckIndex():
+    index = SearchIndex()
+    index.update(["Deck %d::Subdeck %d" % (i, i * 7) for i in range(50000)])
+    return index
+
+
+def test_search_many():
+    index = _deckIndex()
+    assert index.search("deck 1234::") == {"deck 1234::subdeck 8638"}
+
+
+@pytest.mark.benchmark
+def test_keystroke_latency(bench):
+    index = _deckIndex()
+    queries = ["d", "de", "dec", "deck", "deck 1", "deck 12", "deck 123"]
+
+    def typeQuery():
+        for query in queries:
+            index.search(query)
+
+    perKey = bench(typeQuery) / len(queries)
+    assert perKey < 10e-3  # A few ms per keystroke
+
+
+def test_prefix_index():
+    index = PrefixIndex(["German", "japanese::Vocab", "Japanese::Kanji", "Default"])
+    start, stop = index.range("ja")
+    assert sorted(index[i] for i in range(start, stop)) == [
+        "Japanese::Kanji",
+        "japanese::Vocab",
+    ]
+    assert index.range("x")[0] == index.range("x")[1]
+
+    index.add("Jazz")
+    index.remove("German")
+    start, stop = index.range("j")
+    assert [index[i] for i in range(start, stop)] == [
+        "Japanese::Kanji",
+        "japanese::Vocab",
+        "Jazz",
+    ]
+    start, stop = index.range("g")
+    assert start == stop == 1  # Empty, where "German" was
+    assert [index[i] for i in range(len(index))] == [
+        "Default",
+        "Japanese::Kanji",
+        "japanese::Vocab",
+        "Jazz",
+    ]
+
+
+def test_prefix_index_large():
+    index = PrefixIndex("tag%06d" % i for i in range(100000))
+    start, stop = index.range("TAG0999")
+    assert stop - start == 100
+    assert index[start] == "tag099900"
+
+
+def test_prefix_index_replace():
+    labels = ["tag%05d" % i for i in range(1000)]
+    for removeCount in (2, 500):  # Applied one by one, and rebuilt
+        index = PrefixIndex(labels + ["tag00000"])
+        index.replace(labels[:removeCount], ["new", "Tag"])
+        expected = sorted(
+            labels[removeCount:] + ["tag00000", "new", "Tag"], key=str.lower
+        )
+        assert [index[i] for i in range(len(index))] == expected
+
+    with pytest.raises(KeyError):
+        PrefixIndex(labels).replace(["missing"] * 100, [])
@@ -15,11 +15,24 @@
 
 # flake8: noqa
 
+import importlib
 import sys
 import os
+import types
 
 sys.path.insert(
     1, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src/qdlg"))
 )
 
 from observable import *  # NOQA
+
+
+def qdlgModule(name):
+    """Import src/qdlg/<name> without qdlg/__init__, which needs Qt"""
+    if "qdlgcore" not in sys.modules:
+        package = types.ModuleType("qdlgcore")
+        package.__path__ = [
+            os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src/qdlg"))
+        ]
+        sys.modules["qdlgcore"] = package
+    return importlib.import_module("qdlgcore." + name)
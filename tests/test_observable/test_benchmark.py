@@ -0,0 +1,186 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Performance tests. Run with: python -m pytest tests --run-benchmarks"""
+
+import gc
+import random
+import tracemalloc
+
+import pytest
+
+from .obsproxy import observable, unobserved
+
+pytestmark = pytest.mark.benchmark
+
+sizes = [10, 1000, 100000]
+depths = [1, 4, 8]
+
+
+def _notes(n):
+    return [{"id": i, "fields": ["front %d" % i, "back"], "tags": []} for i in range(n)]
+
+
+def _deep(depth):
+    """{"c": {"c": ... {"c": {"leaf": 0}}}} nested depth times"""
+    node = {"leaf": 0}
+    for _ in range(depth):
+        node = {"c": node, "other": [1, 2, 3]}
+    return node
+
+
+def _leafParent(node, depth):
+    for _ in range(depth):
+        node = node["c"]
+    return node
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_construct_eager(bench, n):
+    data = _notes(n)
+    bench(lambda: observable(data))
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_construct_lazy(bench, n):
+    data = _notes(n)
+    bench(lambda: observable(data, lazy=True))
+
+
+def _allocated(fn):
+    """fn(), and the bytes it leaves allocated"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("n", sizes[1:])
+def test_memory_lazy(n):
+    data = _notes(n)
+    _, eager = _allocated(lambda: observable(data))
+    _, lazy = _allocated(lambda: observable(data, lazy=True))
+    assert lazy * 10 < eager, (lazy, eager)
+
+
+def test_memory_per_node():
+    n = 10000
+    data = _notes(n)
+    root, allocated = _allocated(lambda: observable(data))
+    perNode = allocated / (1 + 3 * n)  # The list, and each note with its lists
+    assert not hasattr(root, "__dict__")
+    # About 340 bytes with a __dict__ per node, 230 with slots (CPython 3.11)
+    assert perNode < 300, perNode
+
+
+@pytest.mark.parametrize("depth", depths)
+def test_construct_deep(bench, depth):
+    data = _deep(depth)
+    bench(lambda: observable(data))
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_append(bench, n):
+    a = observable(list(range(n)))
+    a.registerObserver(lambda: None)
+
+    def appendAndPop():
+        a.append(0)
+        a.pop()
+
+    bench(appendAndPop)
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_dict_set(bench, n):
+    a = observable({i: i for i in range(n)})
+    a.registerObserver(lambda: None)
+    bench(lambda: a.__setitem__(0, 1))
+
+
+@pytest.mark.parametrize("depth", depths)
+def test_bubble(bench, depth):
+    a = observable(_deep(depth))
+    node = a
+    for _ in range(depth):
+        node.registerObserver(lambda: None)
+        node = node["c"]
+    bench(lambda: node.__setitem__("leaf", 1))
+
+
+@pytest.mark.parametrize("depth", depths)
+def test_bubble_subscribed(bench, depth):
+    a = observable(_deep(depth))
+    a.subscribe(["c"] * depth + ["leaf"], lambda: None)
+    a.subscribe(["other"], lambda: None)
+    leaf = _leafParent(a, depth)
+    bench(lambda: leaf.__setitem__("leaf", 1))
+
+
+@pytest.mark.parametrize("handlers", [1, 100])
+def test_dispatch(bench, handlers):
+    a = observable({"a": 1})
+    for _ in range(handlers):
+        a.registerObserver(lambda: None)
+    bench(lambda: a.__setitem__("a", 2))
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_snapshot_after_change(bench, n):
+    a = observable(_notes(n))
+
+    def run():
+        a[0]["id"] = 0
+        a.snapshot()
+
+    bench(run)
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_unobserved(bench, n):
+    a = observable(_notes(n))
+    bench(lambda: unobserved(a))
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_equal_to_snapshot(bench, n):
+    a = observable(_notes(n))
+    snap = a.snapshot()
+    bench(lambda: a == snap)
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_equal_to_copy(bench, n):
+    a = observable(_notes(n))
+    data = _notes(n)
+    bench(lambda: a == data)
+
+
+@pytest.mark.parametrize("n", sizes)
+def test_reassign_shuffled(bench, n):
+    data = _notes(n)
+    shuffled = list(data)
+    random.Random(40).shuffle(shuffled)
+    a = observable({"notes": data})
+
+    def run():
+        a["notes"] = shuffled
+        a["notes"] = data
+
+    bench(run)
@@ -0,0 +1,128 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gc
+
+from .obsproxy import observable, computed
+
+
+def _model():
+    return observable(
+        {
+            "decks": [
+                {"id": 1, "name": "Default"},
+                {"id": 2, "name": "Japanese"},
+                {"id": 3, "name": "Japanese::Kanji"},
+            ],
+            "filter": "japanese",
+            "hotkey": "tab",
+        }
+    )
+
+
+def test_computed_memoized():
+    model = _model()
+    runs = []
+
+    def filtered():
+        runs.append(1)
+        query = model["filter"]
+        return [d["name"] for d in model["decks"] if query in d["name"].lower()]
+
+    c = computed(filtered)
+    assert c.value == ["Japanese", "Japanese::Kanji"]
+    assert c.value == ["Japanese", "Japanese::Kanji"]
+    assert len(runs) == 1
+
+    # Not a dependency
+    model["hotkey"] = "enter"
+    assert c.value == ["Japanese", "Japanese::Kanji"]
+    assert len(runs) == 1
+
+    model["filter"] = "default"
+    assert c.value == ["Default"]
+    assert len(runs) == 2
+
+    model["decks"][0]["name"] = "Default 2"
+    assert list(c) == ["Default 2"]
+    assert len(runs) == 3
+
+
+def test_computed_is_observable():
+    model = _model()
+    c = computed(lambda: len(model["decks"]))
+    calls = []
+    c.registerObserver(lambda: calls.append(c.value))
+    assert c.value == 3
+
+    model["decks"].append({"id": 4, "name": "New"})
+    assert calls == [4]
+
+
+def test_computed_lazy_recompute():
+    model = _model()
+    runs = []
+
+    def count():
+        runs.append(1)
+        return len(model["decks"])
+
+    c = computed(count)
+    assert runs == []  # Nothing computed until read
+    assert c.value == 3
+    model["decks"].pop()
+    model["decks"].pop()
+    assert len(runs) == 1
+    assert c.value == 1
+    assert len(runs) == 2
+
+
+def test_computed_chain():
+    model = _model()
+    names = computed(lambda: [d["name"] for d in model["decks"]])
+    count = computed(lambda: len(names.value))
+    assert count.value == 3
+    model["decks"].append({"id": 4, "name": "New"})
+    assert count.value == 4
+
+
+def test_computed_dependencies_change():
+    model = observable({"useA": True, "a": 1, "b": 2})
+    runs = []
+
+    def pick():
+        runs.append(1)
+        return model["a"] if model["useA"] else model["b"]
+
+    c = computed(pick)
+    assert c.value == 1
+    model["b"] = 3  # Not read yet
+    assert c.value == 1
+    assert len(runs) == 1
+
+    model["useA"] = False
+    assert c.value == 3
+    model["a"] = 5  # Not read anymore
+    assert c.value == 3
+    assert len(runs) == 2
+
+
+def test_computed_not_kept_alive_by_dependencies():
+    model = _model()
+    c = computed(lambda: len(model["decks"]))
+    assert c.value == 3
+    del c
+    gc.collect()
+    assert len(model["decks"]._handlerList) == 0
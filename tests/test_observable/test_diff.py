@@ -0,0 +1,174 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+
+import pytest
+
+from .obsproxy import observable
+from observable.changes import ListSplice, ListMove
+from observable.diff import matchKeys, freezeKey
+
+
+def _replay(items, changes):
+    items = list(items)
+    for c in changes:
+        if isinstance(c, ListMove):
+            items.insert(c.toIndex, items.pop(c.fromIndex))
+        else:
+            items[c.index : c.index + len(c.removed)] = c.inserted
+    return items
+
+
+def test_match_keys():
+    matches, stable = matchKeys("abcd", "bcad")
+    assert matches == {0: 2, 1: 0, 2: 1, 3: 3}
+    assert stable == {1, 2, 3}
+
+    matches, stable = matchKeys("aab", "ba")
+    assert matches == {0: 1, 2: 0}
+    assert len(stable) == 1
+
+
+def test_freeze_key():
+    assert freezeKey({"a": [1, (2, 3)]}) == freezeKey({"a": [1, (2, 3)]})
+    assert freezeKey([1]) != freezeKey((1,))
+
+    class Unhashable:
+        __hash__ = None
+
+    obj = Unhashable()
+    assert freezeKey([obj]) == (list, (("id", id(obj)),))
+    with pytest.raises(TypeError):
+        freezeKey({"a": [obj]}, strict=True)
+
+
+def test_reassign_keeps_types():
+    a = observable({"l": [1, 2, {"x": 1}]})
+    a["l"] = [True, 2.0, {"x": True}]
+    assert [type(v) for v in a["l"][:2]] == [bool, float]
+    assert type(a["l"][2]["x"]) is bool
+
+    b = observable({"l": [0.0, 1]})
+    b["l"].diffKey(lambda v: 0 if v == 0 else 1)
+    b["l"] = [False, 1]
+    assert [type(v) for v in b["l"]] == [bool, int]
+    assert freezeKey({1: 1}) != freezeKey({True: True})
+
+
+def test_reuse_children():
+    a = observable([{"id": 1}, {"id": 2}, {"id": 3}])
+    first, second = a[0], a[1]
+    a._observableAssign([{"id": 2}, {"id": 4}, {"id": 1}])
+    assert a[0] is second
+    assert a[2] is first
+    assert a == [{"id": 2}, {"id": 4}, {"id": 1}]
+
+
+def test_child_observers_kept():
+    d = observable({"items": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]})
+    d["items"].diffKey(lambda d: d["id"])
+    second = d["items"][1]
+    calls = []
+    second.registerObserver(lambda: calls.append(1))
+
+    d["items"] = [{"id": 2, "name": "c"}]
+    assert d["items"][0] is second
+    assert second["name"] == "c"
+    assert calls == [1]
+
+
+def test_change_records():
+    a = observable(list("abcdef"))
+    changes = []
+    handle = a.observeChanges(changes.append)
+
+    before = list(a)
+    a._observableAssign(list("fbcxae"))
+    assert _replay(before, changes) == list("fbcxae")
+    assert sum(isinstance(c, ListMove) for c in changes) == 2
+
+    changes.clear()
+    a.append("g")
+    a.insert(0, "h")
+    a.pop(2)
+    assert changes == [
+        ListSplice(a, 6, [], ["g"]),
+        ListSplice(a, 0, [], ["h"]),
+        ListSplice(a, 2, ["b"], []),
+    ]
+
+    handle.dispose()
+    changes.clear()
+    a.clear()
+    assert changes == []
+
+
+def test_change_records_insert_index():
+    a = observable([1, 2, 3])
+    changes = []
+    a.observeChanges(changes.append)
+
+    a.insert(-1, 9)
+    assert a == [1, 2, 9, 3]
+    a.insert(-100, 8)
+    assert a == [8, 1, 2, 9, 3]
+    a.insert(100, 7)
+    assert a == [8, 1, 2, 9, 3, 7]
+    assert changes == [
+        ListSplice(a, 2, [], [9]),
+        ListSplice(a, 0, [], [8]),
+        ListSplice(a, 5, [], [7]),
+    ]
+
+
+def test_change_records_random():
+    rng = random.Random(35)
+    a = observable([])
+    changes = []
+    a.observeChanges(changes.append)
+    for _ in range(100):
+        before = list(a)
+        changes.clear()
+        target = [rng.randrange(8) for _ in range(rng.randrange(10))]
+        a._observableAssign(target)
+        assert list(a) == target
+        assert _replay(before, changes) == target
+
+
+def test_change_records_bubble():
+    d = observable({"items": [1, 2]})
+    changes = []
+    d.observeChanges(changes.append)
+    d["items"].append(3)
+    assert changes == [ListSplice(d["items"], 2, [], [3])]
+
+
+def test_change_records_large():
+    a = observable(list(range(1000)))
+    changes = []
+    a.observeChanges(changes.append)
+    a._observableAssign(list(reversed(range(1000))))
+    assert changes == [ListSplice(a, 0, list(range(1000)), list(reversed(range(1000))))]
+
+
+def test_change_records_scoped():
+    observed = observable({"items": [1]})
+    other = observable({"items": [1]})
+    handle = observed.observeChanges(lambda change: None)
+    assert observed["items"]._changesObserved()
+    assert not other["items"]._changesObserved()
+    handle.dispose()
+    assert not observed["items"]._changesObserved()
@@ -0,0 +1,58 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .obsproxy import observable
+
+
+class CountingEq:
+    calls = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        CountingEq.calls += 1
+        return self.value == other.value
+
+
+def test_equal_to_snapshot():
+    a = observable({"ids": list(range(1000)), "name": "deck"})
+    snap = a.snapshot()
+    assert a == snap
+    assert a["ids"] == snap["ids"]
+
+    a["name"] = "other"
+    assert a != snap
+    a["name"] = "deck"
+    assert a == snap
+
+
+def test_unchanged_subtrees_not_walked():
+    a = observable({"items": [{"id": 1}, {"id": 2}], "name": "deck"})
+    snap = a.snapshot()
+    a["name"] = "other"
+    a["items"][1]["id"] = 3
+
+    assert a["items"][0]._isSameAs(snap["items"][0])
+    assert not a["items"][1]._isSameAs(snap["items"][1])
+    assert a != snap
+
+
+def test_equal_to_self():
+    a = observable([[CountingEq(1)], [CountingEq(2)]])
+    CountingEq.calls = 0
+    assert a == a
+    assert a[0] == a[0]
+    assert CountingEq.calls == 0
@@ -0,0 +1,121 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gc
+
+from .obsproxy import observable
+
+
+class Counter:
+    def __init__(self):
+        self.count = 0
+
+    def inc(self):
+        self.count += 1
+
+
+def test_dispose_observer():
+    a = observable([1, 2])
+    c = Counter()
+    handle = a.registerObserver(c.inc)
+    a.append(3)
+    handle.dispose()
+    a.append(4)
+    assert c.count == 1
+    assert handle.disposed
+    assert len(a._handlerList) == 0
+
+    handle.dispose()  # No-op
+
+
+def test_dispose_subscription():
+    a = observable({"a": {"b": 1}, "c": 2})
+    c = Counter()
+    with a.subscribe(["a", "b"], c.inc):
+        a["a"]["b"] = 2
+    a["a"]["b"] = 3
+    assert c.count == 1
+    assert not a._subscriptions.children  # Emptied tries are pruned
+
+
+def test_weak_observer():
+    a = observable([1, 2])
+    c = Counter()
+    handle = a.registerObserver(c.inc, weak=True)
+    a.append(3)
+    assert c.count == 1
+
+    del c
+    gc.collect()
+    assert handle.disposed
+    assert len(a._handlerList) == 0
+    a.append(4)
+
+
+def test_weak_subscription():
+    a = observable({"a": 1})
+    c = Counter()
+    handle = a.subscribe("a", c.inc, weak=True)
+    a["a"] = 2
+    assert c.count == 1
+
+    del c
+    gc.collect()
+    assert handle.disposed
+    a["a"] = 3
+
+
+def test_dispose_during_dispatch():
+    a = observable([1])
+    calls = []
+    handles = []
+
+    def first():
+        calls.append("first")
+        handles[1].dispose()
+
+    handles.append(a.registerObserver(first))
+    handles.append(a.registerObserver(lambda: calls.append("second")))
+    a.append(2)
+    a.append(3)
+    assert calls == ["first", "second", "first"]
+
+
+class FakeSignal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self._slots:
+            slot(*args)
+
+
+class FakeWidget:
+    def __init__(self):
+        self.destroyed = FakeSignal()
+
+
+def test_dispose_with_widget():
+    a = observable([1])
+    c = Counter()
+    widget = FakeWidget()
+    handle = a.registerObserver(c.inc).disposeWith(widget)
+    widget.destroyed.emit(widget)
+    assert handle.disposed
+    a.append(2)
+    assert c.count == 0
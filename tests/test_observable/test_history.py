@@ -0,0 +1,140 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .obsproxy import observable, History, MicrotaskScheduler, setScheduler
+
+
+class Note:
+    def __init__(self):
+        self.fields = ["front", "back"]
+        self.tags = []
+
+
+def _config():
+    return observable(
+        {
+            "decks": [{"id": 1, "name": "Default"}, {"id": 2, "name": "Other"}],
+            "hotkey": "tab",
+        }
+    )
+
+
+def test_undo_redo():
+    config = _config()
+    history = History(config)
+    original = config.unobserved()
+
+    config["hotkey"] = "enter"
+    config["decks"].append({"id": 3, "name": "New"})
+    config["decks"][0]["name"] = "Renamed"
+    del config["hotkey"]
+    changed = config.unobserved()
+
+    while history.undo():
+        pass
+    assert config.unobserved() == original
+
+    while history.redo():
+        pass
+    assert config.unobserved() == changed
+
+
+def test_undo_keeps_wrappers():
+    config = _config()
+    history = History(config)
+    deck = config["decks"][1]
+    config["decks"].pop(1)
+    history.undo()
+    assert config["decks"][1] is deck
+
+
+def test_undo_reassigned_list():
+    config = _config()
+    history = History(config)
+    config["decks"] = [{"id": 2, "name": "Other"}, {"id": 4, "name": "Four"}]
+    history.undo()
+    assert config["decks"] == [{"id": 1, "name": "Default"}, {"id": 2, "name": "Other"}]
+    assert not history.canUndo()
+    history.redo()
+    assert config["decks"] == [{"id": 2, "name": "Other"}, {"id": 4, "name": "Four"}]
+
+
+def test_object():
+    note = observable(Note())
+    history = History(note)
+    note.fields[0] = "changed"
+    note.tags = ["a"]
+    note.extra = 1
+    history.undo()
+    assert not hasattr(note, "extra")
+    history.undo()
+    history.undo()
+    assert note.fields == ["front", "back"]
+    assert note.tags == []
+
+
+def test_transaction():
+    config = _config()
+    history = History(config)
+    with history.transaction():
+        config["hotkey"] = "a"
+        config["decks"].clear()
+    config["hotkey"] = "b"
+
+    history.undo()
+    assert config["hotkey"] == "a"
+    history.undo()
+    assert config["hotkey"] == "tab"
+    assert len(config["decks"]) == 2
+    assert not history.undo()
+
+
+def test_batch_is_one_step():
+    config = _config()
+    history = History(config)
+    scheduler = MicrotaskScheduler()
+    previous = setScheduler(scheduler)
+    try:
+        with scheduler.batch():
+            config["hotkey"] = "a"
+            config["decks"].append({"id": 3})
+        history.undo()
+        assert config["hotkey"] == "tab"
+        assert len(config["decks"]) == 2
+    finally:
+        setScheduler(previous)
+
+
+def test_new_change_drops_redo():
+    config = _config()
+    history = History(config)
+    config["hotkey"] = "a"
+    history.undo()
+    config["hotkey"] = "b"
+    assert not history.redo()
+    assert config["hotkey"] == "b"
+
+
+def test_limit():
+    a = observable([])
+    history = History(a, limit=5)
+    for i in range(10):
+        a.append(i)
+
+    undone = 0
+    while history.undo():
+        undone += 1
+    assert undone == 5
+    assert a == [0, 1, 2, 3, 4]
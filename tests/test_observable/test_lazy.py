@@ -0,0 +1,111 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .obsproxy import observable, unobserved, snapshot, isObservable
+from .notified import registerNotification, assertNotified, resetNotification
+
+
+def test_lazy_children_wrapped_on_access():
+    a = observable({"a": [{"b": 1}], "c": [1, 2]}, lazy=True)
+    assert not isObservable(a._obj["a"])
+
+    child = a["a"]
+    assert isObservable(child)
+    assert a["a"] is child  # Cached after first access
+    assert not isObservable(child._obj[0])
+    assert isObservable(child[0])
+
+
+def test_lazy_notification():
+    k = observable(
+        {"a": [{"b": 1, "c": 2}, {"b": 2, "c": 3}], "b": [{"b": 3, "c": 4}]},
+        lazy=True,
+    )
+    registerNotification(k)
+    registerNotification(k["a"])
+    registerNotification(k["a"][0])
+    registerNotification(k["b"])
+
+    resetNotification()
+    k["a"][0]["b"] = 2
+    assert k["a"][0]["b"] == 2
+    assertNotified(
+        [
+            (k, 1),
+            (k["a"], 1),
+            (k["a"][0], 1),
+        ]
+    )
+
+    resetNotification()
+    k["a"] = [{"b": 0, "c": 7}]
+    assertNotified(
+        [
+            (k, 1),
+            (k["a"], 1),
+        ]
+    )
+    assert k == {"a": [{"b": 0, "c": 7}], "b": [{"b": 3, "c": 4}]}
+
+
+class ClassHavingListAttribute:
+    def __init__(self):
+        self.l = [1, 2]
+
+
+def test_lazy_object():
+    a = observable(ClassHavingListAttribute(), lazy=True)
+    registerNotification(a)
+    registerNotification(a.l)
+
+    resetNotification()
+    a.l[0] = 3
+    assert a.l == [3, 2]
+    assertNotified(
+        [
+            (a, 1),
+            (a.l, 1),
+        ]
+    )
+
+
+def test_lazy_unobserved_is_a_copy():
+    source = {"a": [[1, 2]], "b": {"c": [3]}}
+    a = observable(source, lazy=True)
+    plain = unobserved(a)
+    assert plain == source
+    assert plain["a"] is not source["a"]
+    assert plain["b"]["c"] is not source["b"]["c"]
+    assert snapshot(a) == source
+
+
+def _notes(n):
+    return [
+        {"id": i, "fields": ["front %d" % i, "back %d" % i], "tags": ["tag"]}
+        for i in range(n)
+    ]
+
+
+def test_lazy_construction_wraps_nothing():
+    eager = observable(_notes(100))
+    assert all(isObservable(note) for note in eager._obj)
+    assert all(isObservable(note._obj["fields"]) for note in eager._obj)
+
+    lazy = observable(_notes(100), lazy=True)
+    assert not any(isObservable(note) for note in lazy._obj)
+
+    lazy[5]["fields"]
+    assert [i for i, note in enumerate(lazy._obj) if isObservable(note)] == [5]
+    assert not isObservable(lazy[5]._obj["tags"])
@@ -167,3 +167,24 @@ def test_notification_count():
 
     allDecks[0] = {"id": 7, "name": "Default 7"}
     assertNotified([(allDecks, 1), (allDecks[0], 1)])
+
+
+def test_version_stamp():
+    a = observable([[1, 2], [3, 4]])
+    v, v0, v1 = a._version, a[0]._version, a[1]._version
+
+    a[0][0] = 0
+    assert a._version != v
+    assert a[0]._version != v0
+    assert a[1]._version == v1
+
+
+def test_compact_nodes():
+    a = observable([[1], [2]])
+    assert not hasattr(a, "__dict__")
+    # Nodes without observers share one empty handler list
+    assert a[0]._handlerList is a[1]._handlerList
+
+    registerNotification(a[0])
+    assert a[0]._handlerList is not a[1]._handlerList
+    assert len(a[1]._handlerList) == 0
@@ -15,6 +15,7 @@
 
 import pytest
 from .obsproxy import observable
+import observable.ObservableObject as ObservableObjectModule
 from .notified import registerNotification, assertNotified, resetNotification
 
 
@@ -113,3 +114,67 @@ def test_obj_method_const():
         ]
     )
     assert a.attrsum() == 5
+
+
+def test_object_equality():
+    a = observable(A())
+    assert a == A()
+    assert a == a
+
+    other = A()
+    other.attr1 = 5
+    assert a != other
+    assert a != B()
+
+
+def test_new_attribute():
+    a = observable(A())
+    registerNotification(a)
+    resetNotification()
+
+    a.attr3 = [1, 2]
+    assertNotified([(a, 1)])
+    registerNotification(a.attr3)
+
+    resetNotification()
+    a.attr3.append(3)
+    assert a.attr3 == [1, 2, 3]
+    assertNotified([(a, 1), (a.attr3, 1)])
+
+
+def test_attribute_schema_cached(monkeypatch):
+    a = observable(A())
+    a.attr1 = 0  # Warm the schema cache
+
+    def fail(*args):
+        raise AssertionError("reflection on cached schema")
+
+    monkeypatch.setattr(ObservableObjectModule, "nonObservableAttribute", fail)
+    a.attr1 = 5
+    assert a != A()
+    assert a.attrsum() == 7
+
+
+def test_attribute_schema_replaced_attribute():
+    a = observable(A())
+    a.attr1 = 0  # Warm the schema cache
+
+    # Same attribute count, different names
+    with a._noNotify():
+        a._setChild("attr1", ObservableObjectModule.missing)
+        a._setChild("attr3", 0)
+    a.attr3 = [1, 2]
+    registerNotification(a.attr3)
+    resetNotification()
+    a.attr3.append(3)
+    assertNotified([(a.attr3, 1)])
+
+
+def test_schema_cache_bounded():
+    for i in range(ObservableObjectModule._schemaCacheSize + 10):
+        obj = A()
+        setattr(obj, "dynamic%d" % i, i)
+        observable(obj)
+    assert len(ObservableObjectModule._schemaCache) <= (
+        ObservableObjectModule._schemaCacheSize
+    )
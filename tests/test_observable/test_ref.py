@@ -0,0 +1,127 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .obsproxy import observable, isObservable, unobserved, snapshot, qdlgModule
+from observable.ref import ObservableRef
+
+
+def test_forwarding():
+    a = observable({"ids": [1, 2], "name": "a"})
+    ref = ObservableRef(a)
+    assert isObservable(ref)
+    assert ref["name"] == "a"
+    assert "ids" in ref
+    assert len(ref) == 2
+    ref["name"] = "b"
+    assert a["name"] == "b"
+    assert ref == {"ids": [1, 2], "name": "b"}
+    assert unobserved(ref) == {"ids": [1, 2], "name": "b"}
+    assert snapshot(ref) is a.snapshot()
+
+
+def test_retarget_moves_observers():
+    a = observable({"name": "a", "other": 0})
+    b = observable({"name": "b", "other": 0})
+    ref = ObservableRef(a)
+
+    calls = []
+    ref.registerObserver(lambda: calls.append("all"))
+    ref.subscribe("name", lambda: calls.append("name"))
+
+    ref.retarget(b)
+    assert sorted(calls) == ["all", "name"]
+
+    calls.clear()
+    a["name"] = "x"
+    assert calls == []
+    b["name"] = "y"
+    assert sorted(calls) == ["all", "name"]
+    calls.clear()
+    b["other"] = 1
+    assert calls == ["all"]
+
+
+def test_dispose():
+    a = observable([1])
+    b = observable([2])
+    ref = ObservableRef(a)
+    calls = []
+    handle = ref.registerObserver(lambda: calls.append(1))
+    handle.dispose()
+    a.append(2)
+    ref.retarget(b)
+    b.append(3)
+    assert calls == []
+
+
+def test_object_attributes():
+    class Note:
+        def __init__(self):
+            self.tags = []
+
+    ref = ObservableRef(observable(Note()))
+    ref.tags = ["a"]
+    assert ref.tags == ["a"]
+
+
+def test_child_references_follow():
+    a = observable({"deck": {"ids": [1]}})
+    b = observable({"deck": {"ids": [2]}})
+    ref = ObservableRef(a)
+    ids = ref["deck"]["ids"]
+    assert isinstance(ids, ObservableRef)
+    assert ref["deck"]["ids"] is ids
+
+    calls = []
+    ids.registerObserver(lambda: calls.append(1))
+    ref.retarget(b)
+    assert calls == [1]
+    assert ids == [2]
+    ids.append(3)
+    assert b["deck"]["ids"] == [2, 3]
+    assert calls == [1, 1]
+    a["deck"]["ids"].append(4)
+    assert calls == [1, 1]
+
+
+def test_version():
+    from observable.ObservableBase import observableVersion
+
+    a = observable({"ids": [1]})
+    ids = ObservableRef(a)["ids"]
+    version = observableVersion(ids)
+    ids.append(2)
+    assert observableVersion(ids) != version
+
+
+def test_binding_follows_retarget():
+    configureModel = qdlgModule("modelHandler").configureModel
+    core = qdlgModule("observable")
+    Ref = qdlgModule("observable.ref").ObservableRef
+
+    a = core.observable({"ids": [1], "name": "a"})
+    b = core.observable({"ids": [2], "name": "b"})
+    assert a["ids"]._version == b["ids"]._version  # Both fresh
+    ref = Ref(a)
+
+    shown = {}
+    configureModel(
+        ref, lambda f: None, lambda v: shown.__setitem__("name", v), index="name"
+    )
+    configureModel(
+        ref, lambda f: None, lambda v: shown.__setitem__("ids", list(v)), index="ids"
+    )
+    ref.retarget(b)
+    assert shown == {"ids": [2], "name": "b"}
@@ -0,0 +1,86 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from .obsproxy import observable, setScheduler, MicrotaskScheduler
+
+
+@pytest.fixture
+def microtask():
+    scheduler = MicrotaskScheduler()
+    previous = setScheduler(scheduler)
+    yield scheduler
+    setScheduler(previous)
+
+
+def test_microtask_runs_after_operation(microtask):
+    a = observable({"a": [1, 2]})
+    calls = []
+
+    def observer():
+        calls.append(a.snapshot())
+
+    a.registerObserver(observer)
+    a["a"].registerObserver(observer)
+    a["a"].append(3)
+
+    # Coalesced into one call, which sees the final state
+    assert calls == [{"a": [1, 2, 3]}]
+
+
+def test_microtask_batch(microtask):
+    a = observable([1, 2])
+    calls = []
+    a.registerObserver(lambda: calls.append(len(a)))
+
+    with microtask.batch():
+        a.append(3)
+        a.append(4)
+        a.pop()
+        assert calls == []
+    assert calls == [3]
+
+
+def test_microtask_cascading_changes(microtask):
+    a = observable({"src": 1, "dst": 0})
+    calls = []
+
+    def copy():
+        a["dst"] = a["src"] * 2
+
+    a.subscribe("src", copy)
+    a.subscribe("dst", lambda: calls.append(a["dst"]))
+
+    a["src"] = 5
+    assert calls == [10]
+    assert a["dst"] == 10
+
+
+def test_microtask_raising_handler_keeps_queue(microtask):
+    a = observable([1])
+    calls = []
+
+    def fail():
+        raise RuntimeError
+
+    a.registerObserver(fail)
+    a.registerObserver(lambda: calls.append(1))
+    with pytest.raises(RuntimeError):
+        a.append(2)
+    assert calls == []
+
+    microtask.flush()
+    assert calls == [1]
@@ -0,0 +1,126 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .obsproxy import observable, History
+from .notified import registerNotification, assertNotified, resetNotification
+from observable.changes import SetChange
+from observable.ObservableSet import ObservableSet
+from observable.ObservableTuple import ObservableTuple
+
+
+class TestSet:
+    def setup_method(self, method):
+        global a
+        a = observable({"ids": {1, 2}})
+        registerNotification(a)
+        registerNotification(a["ids"])
+        resetNotification()
+
+    def test_type(self):
+        assert type(a["ids"]) is ObservableSet
+        assert 1 in a["ids"]
+        assert a["ids"] == {1, 2}
+        assert a.unobserved() == {"ids": {1, 2}}
+
+    def test_add(self):
+        a["ids"].add(3)
+        assertNotified([(a, 1), (a["ids"], 1)])
+        assert a["ids"] == {1, 2, 3}
+
+    def test_add_existing(self):
+        a["ids"].add(1)
+        a["ids"].discard(5)
+        a["ids"].update([1, 2])
+        assertNotified([])
+
+    def test_update(self):
+        a["ids"].update([2, 3], [4])
+        a["ids"].difference_update([1, 3])
+        assertNotified([(a, 2), (a["ids"], 2)])
+        assert a["ids"] == {2, 4}
+
+    def test_operators(self):
+        assert a["ids"] - {1} == {2}
+        assert {1, 3} - a["ids"] == {3}
+        assert a["ids"] | observable({3}) == {1, 2, 3}
+        assert a["ids"] <= {1, 2, 3}
+
+    def test_assign(self):
+        ids = a["ids"]
+        a["ids"] = [2, 3]
+        assert a["ids"] is ids
+        assert ids == {2, 3}
+
+
+def test_element_subscription():
+    s = observable({1, 2})
+    calls = []
+    s.subscribe(3, lambda: calls.append(3))
+    s.add(4)
+    s.add(3)
+    s.discard(3)
+    assert calls == [3, 3]
+
+
+def test_change_records():
+    s = observable({1, 2})
+    changes = []
+    s.observeChanges(changes.append)
+    s.update([2, 3])
+    s.discard(1)
+    assert changes == [SetChange(s, (3,), ()), SetChange(s, (), (1,))]
+
+
+def test_history():
+    s = observable({"ids": {1, 2}})
+    history = History(s)
+    s["ids"].add(3)
+    s["ids"].clear()
+    history.undo()
+    assert s["ids"] == {1, 2, 3}
+    history.undo()
+    assert s["ids"] == {1, 2}
+
+
+def test_snapshot():
+    s = observable({1, 2})
+    assert s.snapshot() == frozenset({1, 2})
+    assert s == s.snapshot()
+
+
+def test_immutable_tuple():
+    a = observable({"pair": (1, "a"), "nested": ([1], {"b": 2})})
+    assert type(a["pair"]) is tuple
+    assert type(a["nested"]) is ObservableTuple
+
+    calls = []
+    a.registerObserver(lambda: calls.append(1))
+    a["nested"][0].append(2)
+    assert calls == [1]
+    assert a.unobserved() == {"pair": (1, "a"), "nested": ([1, 2], {"b": 2})}
+
+    a["nested"] = ([3], {})
+    assert a["nested"][0] == [3]
+
+
+def test_bytearray():
+    a = observable({"data": bytearray(b"abc")})
+    calls = []
+    a.registerObserver(lambda: calls.append(1))
+    a["data"].append(ord("d"))
+    a["data"][0] = ord("x")
+    assert calls == [1, 1]
+    assert a.unobserved() == {"data": bytearray(b"xbcd")}
+    assert a.snapshot() == {"data": b"xbcd"}
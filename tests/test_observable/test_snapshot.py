@@ -0,0 +1,56 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .obsproxy import observable, snapshot
+
+
+def test_snapshot_equals_unobserved():
+    a = observable({"a": [{"b": 1}, {"b": 2}], "c": {"d": [1, 2]}})
+    assert snapshot(a) == a.unobserved()
+    assert snapshot(1) == 1
+
+
+def test_snapshot_reused_when_unchanged():
+    a = observable({"a": [{"b": 1}, {"b": 2}], "c": {"d": [1, 2]}})
+    s1 = snapshot(a)
+    s2 = snapshot(a)
+    assert s1 is s2
+
+
+def test_snapshot_invalidates_only_mutation_path():
+    a = observable({"a": [{"b": 1}, {"b": 2}], "c": {"d": [1, 2]}})
+    s1 = snapshot(a)
+
+    a["a"][1]["b"] = 3
+    s2 = snapshot(a)
+    assert s2 == {"a": [{"b": 1}, {"b": 3}], "c": {"d": [1, 2]}}
+    assert s1 == {"a": [{"b": 1}, {"b": 2}], "c": {"d": [1, 2]}}
+
+    assert s2 is not s1
+    assert s2["a"] is not s1["a"]
+    assert s2["a"][1] is not s1["a"][1]
+    # Siblings of the mutation path are shared
+    assert s2["a"][0] is s1["a"][0]
+    assert s2["c"] is s1["c"]
+
+
+def test_snapshot_after_reassign():
+    a = observable({"a": [1, 2], "b": [3]})
+    s1 = snapshot(a)
+
+    a["a"] = [4]
+    s2 = snapshot(a)
+    assert s2 == {"a": [4], "b": [3]}
+    assert s2["b"] is s1["b"]
@@ -0,0 +1,151 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .obsproxy import observable, qdlgModule
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, name):
+        return lambda: self.calls.append(name)
+
+
+def _config():
+    return observable(
+        {
+            "blacklistDeckIds": [1, 2],
+            "firstCommitHotkey": "tab",
+            "decks": [{"id": 1, "name": "Default"}, {"id": 2, "name": "Other"}],
+        }
+    )
+
+
+def test_subscribe_key():
+    config = _config()
+    r = Recorder()
+    config.subscribe("blacklistDeckIds", r("blacklist"))
+    config.subscribe("firstCommitHotkey", r("hotkey"))
+
+    config["firstCommitHotkey"] = "enter"
+    assert r.calls == ["hotkey"]
+
+    r.calls.clear()
+    config["blacklistDeckIds"].append(3)
+    assert r.calls == ["blacklist"]
+
+    r.calls.clear()
+    config["blacklistDeckIds"] = []
+    assert r.calls == ["blacklist"]
+
+
+def test_subscribe_path():
+    config = _config()
+    r = Recorder()
+    config.subscribe(["decks", 0, "name"], r("name0"))
+    config.subscribe(["decks", 1, "name"], r("name1"))
+    config.subscribe(["decks", 0], r("deck0"))
+    config.subscribe("decks", r("decks"))
+
+    config["decks"][0]["name"] = "Renamed"
+    assert r.calls == ["decks", "deck0", "name0"]
+
+    r.calls.clear()
+    config["decks"][0]["id"] = 3
+    assert r.calls == ["decks", "deck0"]
+
+    r.calls.clear()
+    config["decks"][1] = {"id": 2, "name": "Renamed"}
+    assert r.calls == ["decks", "name1"]
+
+    # Whole-node changes reach every subscriber below
+    r.calls.clear()
+    config["decks"] = []
+    assert sorted(r.calls) == ["deck0", "decks", "name0", "name1"]
+
+
+def test_subscribe_empty_path():
+    config = _config()
+    r = Recorder()
+    config.subscribe([], r("root"))
+    config["decks"][0]["name"] = "Renamed"
+    assert r.calls == ["root"]
+
+
+def test_subscribe_delete():
+    config = _config()
+    r = Recorder()
+    config.subscribe("firstCommitHotkey", r("hotkey"))
+    del config["firstCommitHotkey"]
+    assert r.calls == ["hotkey"]
+
+
+class A:
+    def __init__(self):
+        self.attr1 = 1
+        self.attr2 = [1, 2]
+
+
+def test_subscribe_object():
+    a = observable(A())
+    r = Recorder()
+    a.subscribe("attr1", r("attr1"))
+    a.subscribe("attr2", r("attr2"))
+
+    a.attr1 = 5
+    assert r.calls == ["attr1"]
+
+    r.calls.clear()
+    a.attr2[0] = 3
+    assert r.calls == ["attr2"]
+
+
+def test_subscribe_child_lookup_cached(monkeypatch):
+    a = observable({"items": [{"v": i} for i in range(100)]})
+    r = Recorder()
+    for i in range(100):
+        a.subscribe(["items", i, "v"], r(i))
+
+    ObservableList = type(a["items"])
+    lookups = []
+    childAt = ObservableList._childAt
+
+    def countingChildAt(self, key):
+        lookups.append(key)
+        return childAt(self, key)
+
+    monkeypatch.setattr(ObservableList, "_childAt", countingChildAt)
+    a["items"][99]["v"] = 0
+    lookups.clear()
+    a["items"][99]["v"] = 1
+    assert lookups == [99]
+    assert r.calls == [99, 99]
+
+    # Paths are positional, and a shifted child is found at its new index
+    a["items"].insert(0, {"v": -1})
+    r.calls.clear()
+    a["items"][99]["v"] = 2
+    assert r.calls == [99]
+
+
+def test_model_negative_index():
+    configureModel = qdlgModule("modelHandler").configureModel
+    items = qdlgModule("observable").observable(["x", "y"])
+    shown = []
+    configureModel(items, lambda f: None, shown.append, index=-1)
+    items[-1] = "z"
+    items.append("w")
+    assert shown == ["y", "z", "w"]
@@ -0,0 +1,44 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    LineEdit,
+    Button,
+    observable,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("runAsync test")
+def qDlgClass(dlg, model):
+    LineEdit().model(model, index="name")
+    Button("OK").onClick(dlg.accept)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    model = observable({"name": "Default"})
+
+    def onDone(future):
+        result = future.result()
+        print("accepted:", result.accepted, "model:", result.models[0])
+        app.quit()
+
+    # Returns right away. The event loop below is the only one running.
+    qDlgClass.runAsync(model).add_done_callback(onDone)
+    print("runAsync returned")
+    app.exec_()
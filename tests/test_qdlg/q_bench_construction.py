@@ -0,0 +1,62 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import time
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    Text,
+    Group,
+    LineEdit,
+    CheckBox,
+    Table,
+    Tr,
+    Td,
+    observable,
+)
+from aqt.qt import QApplication, QTimer
+
+rowCount = 125  # 4 widgets per row
+
+
+@QDlg("Construction benchmark")
+def qDlgClass(dlg, model):
+    with Group("Settings"):
+        with Table():
+            for i in range(rowCount):
+                with Tr():
+                    with Td():
+                        Text("Option %d" % i).style("color: #333")
+                    with Td():
+                        LineEdit().model(model["texts"], index=i)
+                    with Td():
+                        CheckBox().model(model["checks"], index=i)
+                    with Td():
+                        Text("Hint %d" % i)
+
+    def onShown():
+        # First event loop iteration: built, laid out and shown
+        elapsed = time.perf_counter() - buildStart
+        print("%d widgets: %.0f ms" % (rowCount * 4, elapsed * 1e3))
+        dlg.accept()
+
+    QTimer.singleShot(0, onShown)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    model = observable({"texts": [""] * rowCount, "checks": [False] * rowCount})
+    buildStart = time.perf_counter()
+    qDlgClass.run(model)
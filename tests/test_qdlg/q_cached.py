@@ -0,0 +1,51 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import time
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    Text,
+    LineEdit,
+    ListBox,
+    observable,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("Cached dialog test", cached=True)
+def qDlgClass(dlg, model):
+    Text("Name")
+    LineEdit().model(model, index="name")
+    ListBox(model["decks"])
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+
+    # The second run should open much faster, and show the second model
+    for name in ["First", "Second"]:
+        model = observable(
+            {"name": name, "decks": ["%s deck %d" % (name, i) for i in range(20000)]}
+        )
+        start = time.perf_counter()
+        qDlgClass.run(model)
+        print(
+            name,
+            model.unobserved()["name"],
+            "%.0f ms" % ((time.perf_counter() - start) * 1e3),
+        )
+
+    qDlgClass.invalidate()
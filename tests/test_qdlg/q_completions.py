@@ -0,0 +1,46 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    Text,
+    LineEdit,
+    Button,
+    observable,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("LineEdit completions test")
+def qDlgClass(dlg):
+    tags = observable(["tag%06d" % i for i in range(100000)])
+    decks = observable([{"id": 1, "name": "Default"}, {"id": 2, "name": "Japanese"}])
+
+    Text("Tag (100k candidates)")
+    LineEdit().completions(tags)
+    Button("Add tag 'zzz'").onClick(lambda: tags.append("zzz"))
+
+    Text("Deck")
+    LineEdit().completions(decks, key=lambda deck: deck["name"])
+    # Replaces the one label in the index
+    Button("Rename 'Japanese'").onClick(
+        lambda: decks[1].__setitem__("name", "Japanese::Vocab")
+    )
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    qDlgClass.run()
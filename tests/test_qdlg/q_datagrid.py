@@ -0,0 +1,63 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    DataGrid,
+    Column,
+    LineEdit,
+    Button,
+    HStack,
+    observable,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("DataGrid test", size=(600, 500))
+def qDlgClass(dlg):
+    notes = observable(
+        [{"id": i, "front": "Front %d" % i, "due": i % 365} for i in range(100000)]
+    )
+
+    grid = (
+        DataGrid(
+            notes,
+            [
+                Column("ID", "id", width=80),
+                Column("Front", "front"),
+                Column("Due", "due", renderer=lambda d: "in %d days" % d),
+            ],
+        )
+        .sortable()
+        .multiselect()
+    )
+    LineEdit().placeholderText("Filter").onInput(grid.filter)
+
+    def removeSelected():
+        for note in grid.selected():
+            notes.pop(next(i for i, n in enumerate(notes) if n is note))
+
+    with HStack():
+        Button("Add").onClick(
+            lambda: notes.insert(0, {"id": len(notes), "front": "New", "due": 0})
+        )
+        Button("Rename first").onClick(lambda: notes[0].__setitem__("front", "Renamed"))
+        Button("Remove selected").onClick(removeSelected)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    qDlgClass.run()
@@ -0,0 +1,60 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    Text,
+    LineEdit,
+    CheckBox,
+    Button,
+    ListBox,
+    Dynamic,
+    observable,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("Dynamic section test")
+def qDlgClass(dlg):
+    model = observable({"advanced": False, "fields": ["Front", "Back"]})
+
+    CheckBox().model(model, index="advanced")
+
+    def fields():
+        # Keyed: kept across rebuilds, but shows the new count and style
+        Text("%d fields" % len(model["fields"])).key("count").style(
+            "color: %s;" % ("red" if len(model["fields"]) > 3 else "black")
+        )
+        # Keyed as a whole, with its filter box
+        ListBox(list(model["fields"]), filterable=True).key("list")
+        for field in model["fields"]:
+            Text(field)
+            # Keyed: keeps its text when fields are added or removed
+            LineEdit().key(field)
+        if model["advanced"]:
+            Text("Advanced options").style("font-weight: bold")
+
+    # Only this section is rebuilt on changes
+    Dynamic(fields, deps=[model])
+    Button("Add field").onClick(
+        lambda: model["fields"].insert(0, "Field %d" % len(model["fields"]))
+    )
+    Button("Remove last field").onClick(lambda: model["fields"].pop())
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    qDlgClass.run()
@@ -0,0 +1,45 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sys
+from qdlgproxy import QDlg, ListBox, Button, Text, observable
+from aqt.qt import QApplication
+
+
+@QDlg("ListBox render cache test")
+def qDlgClass(dlg):
+    decks = observable([{"id": i, "name": "Deck %d" % i} for i in range(1000)])
+
+    def renderer(d):
+        return "%s (%d)" % (d["name"], d["id"])
+
+    listBox = ListBox(decks, renderer=renderer).renderCache(key=lambda d: d["id"])
+    stats = Text("")
+
+    def updateStats():
+        stats.widget.setText(str(listBox.renderCacheStats()))
+
+    def renameFirst():
+        decks[0]["name"] += "!"
+        updateStats()  # Expect 1 miss, 999 hits per rename
+
+    Button("Rename first deck").onClick(renameFirst)
+    updateStats()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    qDlgClass.run()
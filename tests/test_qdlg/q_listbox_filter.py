@@ -0,0 +1,37 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    ListBox,
+    Button,
+    observable,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("ListBox filter test", size=(400, 600))
+def qDlgClass(dlg):
+    decks = observable(["Deck %d::Subdeck %d" % (i, i * 7) for i in range(50000)])
+    # Typing into the filter box should stay responsive
+    ListBox(decks, filterable=True).multiselect()
+    # The filter stays applied to added items
+    Button("Add deck").onClick(lambda: decks.append("Deck %d::New" % len(decks)))
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    qDlgClass.run()
@@ -0,0 +1,61 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    Text,
+    RadioButton,
+    RadioGroup,
+    Button,
+    Dynamic,
+    observable,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("RadioGroup test")
+def qDlgClass(dlg):
+    model = observable({"selection": 3})
+
+    # One binding for the whole group, and one change per click
+    with RadioGroup().model(model, index="selection").onChange(print):
+        for i in range(1, 101):
+            RadioButton("Item %d" % i, value=i)
+
+    Button("Select 50 from model").onClick(lambda: model.__setitem__("selection", 50))
+    Button("Clear").onClick(lambda: model.__setitem__("selection", None))
+
+    # Rebuilt buttons stay in the group, and keyed ones follow their new value
+    choices = observable({"count": 3, "selection": 2})
+
+    def buttons():
+        for i in range(1, choices["count"] + 1):
+            RadioButton("Choice %d" % i, value=i).key(i)
+
+    with RadioGroup().model(choices, index="selection").onChange(print):
+        Dynamic(buttons, deps=[choices])
+
+    Button("More choices").onClick(
+        lambda: choices.__setitem__("count", choices["count"] + 1)
+    )
+    Button("Fewer choices").onClick(
+        lambda: choices.__setitem__("count", max(1, choices["count"] - 1))
+    )
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    qDlgClass.run()
@@ -0,0 +1,46 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sys
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    LineEdit,
+    ListBox,
+    observable,
+    setScheduler,
+    QtIdleScheduler,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("Debounced scheduler test")
+def qDlgClass(dlg):
+    model = observable({"text": "", "history": []})
+
+    def onTextChange():
+        model["history"].append(model["text"])
+
+    model.subscribe("text", onTextChange)
+
+    # History should get one entry per typing pause, not per key
+    LineEdit().model(model, index="text")
+    ListBox(model["history"])
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    setScheduler(QtIdleScheduler(debounceMs=300))
+    qDlgClass.run()
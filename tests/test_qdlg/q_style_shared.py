@@ -0,0 +1,39 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    Text,
+    Button,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("Shared style test")
+def qDlgClass(dlg):
+    # 200 rows share two rules in a single stylesheet on the dialog
+    for i in range(200):
+        Text("Row %d" % i).style("color: %s;" % ("red" if i % 2 else "blue"))
+
+    # Styled after construction: adds one rule, then reuses it
+    label = Text("Restyled")
+    Button("Restyle").onClick(lambda: label.style("font-weight: bold;"))
+    Button("Print stylesheet").onClick(lambda: print(dlg.styleSheet()))
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    qDlgClass.run()
@@ -0,0 +1,57 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import time
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    Text,
+    LineEdit,
+    CheckBox,
+    Tabs,
+    Page,
+    observable,
+)
+from aqt.qt import QApplication
+
+pageCount = 10
+rowsPerPage = 100
+
+
+@QDlg("Tabs test")
+def qDlgClass(dlg, model):
+    with Tabs():
+        for p in range(pageCount):
+
+            @Page("Page %d" % p)
+            def _(p=p):
+                start = time.perf_counter()
+                for i in range(rowsPerPage):
+                    Text("Option %d-%d" % (p, i))
+                    CheckBox().model(model[p], index=i)
+                print(
+                    "Page %d built in %.0f ms"
+                    % (p, (time.perf_counter() - start) * 1e3)
+                )
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    model = observable([[False] * rowsPerPage for _ in range(pageCount)])
+    # Only "Page 0 built" should print before the dialog shows
+    start = time.perf_counter()
+    qDlgClass.runAsync(model).add_done_callback(lambda f: app.quit())
+    print("Dialog built in %.0f ms" % ((time.perf_counter() - start) * 1e3))
+    app.exec_()
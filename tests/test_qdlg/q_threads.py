@@ -0,0 +1,46 @@
+# Copyright (C) 2020 Hyun Woo Park
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import threading
+from qdlgproxy import (  # type: ignore
+    QDlg,
+    Button,
+    ListBox,
+    observable,
+    setScheduler,
+    QtThreadScheduler,
+)
+from aqt.qt import QApplication
+
+
+@QDlg("Worker thread test")
+def qDlgClass(dlg):
+    model = observable({"decks": []})
+
+    def scan():
+        # Simulates a slow collection scan. The list box should fill in a few
+        # batches without freezing the dialog.
+        for i in range(5000):
+            model["decks"].append("Deck %d" % i)
+
+    Button("Scan").onClick(lambda: threading.Thread(target=scan).start())
+    ListBox(model["decks"])
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    setScheduler(QtThreadScheduler(intervalMs=50))
+    qDlgClass.run()